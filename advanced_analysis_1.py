@@ -3,25 +3,136 @@ Questions 4-10: Additional EDA Analysis Modules
 Comprehensive analyses covering payment methods, categories, prime, geography,
 festivals, price-demand, and delivery performance.
 """
+import functools
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from eda.analysis_helpers import ensure_order_date
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+# Least recently used results beyond this many are deleted from CACHE_DIR
+CACHE_MAX_ENTRIES = 64
+
+# Any edit to this module (an analysis, a helper it calls or a literal) changes every cache key
+with open(__file__, 'rb') as _source:
+    _SOURCE_DIGEST = hashlib.blake2b(_source.read(), digest_size=4).hexdigest()
+
+
+def prepare_df(df):
+    """Parse dates, cast grouping keys to category and downcast amounts once; later calls are no-ops"""
+    ensure_order_date(df)
+    if 'year' not in df.columns:
+        df['year'] = df['order_date'].dt.year.astype(np.int16)
+    for col in ('payment_method', 'category', 'customer_state', 'festival_name'):
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    for col in ('final_amount_inr', 'original_price_inr', 'discount_percent', 'customer_rating'):
+        if col in df.columns and df[col].dtype == np.float64:
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+def _frame_digest(df):
+    """Content hash of a frame's column names, dtypes and values, stable across processes and runs"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _prune_cache():
+    """Delete the least recently used results beyond CACHE_MAX_ENTRIES"""
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith('.pkl'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+    for _, path in sorted(entries, reverse=True)[CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def disk_cached(func):
+    """Persist an analysis result on disk, keyed by this module's source and the frame's contents.
 
+    The full frame is hashed on every call, so in-place edits always miss. Hits refresh an entry's
+    mtime and writes prune CACHE_DIR to CACHE_MAX_ENTRIES.
+    """
+    @functools.wraps(func)
+    def wrapper(df):
+        prepare_df(df)
+        path = os.path.join(CACHE_DIR, f"{func.__name__}-{_SOURCE_DIGEST}-{_frame_digest(df)}.pkl")
+        try:
+            with open(path, 'rb') as fh:
+                result = pickle.load(fh)
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            pass
+        result = func(df)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump(result, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        _prune_cache()
+        return result
+    return wrapper
+
+
+def _nunique_by(keys, ids):
+    """Distinct ids per key, counted on factorized integer codes instead of per-group hash sets"""
+    key_codes, key_values = pd.factorize(keys, sort=True)
+    id_codes, id_values = pd.factorize(ids)
+    valid = (key_codes >= 0) & (id_codes >= 0)
+    pairs = pd.unique(key_codes[valid].astype(np.int64) * len(id_values) + id_codes[valid])
+    return pd.Series(np.bincount(pairs // len(id_values), minlength=len(key_values)),
+                     index=pd.Index(key_values, name=keys.name))
+
+
+def _bin_count(codes, values, n_bins):
+    """Non-null values per bin code (codes < 0 are skipped), like groupby count"""
+    mask = (codes >= 0) & values.notna().to_numpy()
+    return np.bincount(codes[mask], minlength=n_bins)
+
+
+def _bin_mean(codes, values, n_bins):
+    """NaN-skipping mean of values per bin code via weighted bincount, like groupby mean"""
+    values = values.to_numpy(dtype=np.float64)
+    mask = (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[mask], weights=values[mask], minlength=n_bins)
+    counts = np.bincount(codes[mask], minlength=n_bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+
+@disk_cached
 def payment_evolution_analysis(df):
     """Question 4: Payment method evolution from 2015-2025"""
-    df['order_date'] = pd.to_datetime(df['order_date'])
-    df['year'] = df['order_date'].dt.year
+    prepare_df(df)
     
-    payment_yearly = df.groupby(['year', 'payment_method']).size().unstack(fill_value=0)
-    payment_pct = payment_yearly.div(payment_yearly.sum(axis=1), axis=0) * 100
+    payment_yearly = pd.crosstab(df['year'], df['payment_method'])
+    counts = payment_yearly.to_numpy()
+    shares = counts / counts.sum(axis=1, keepdims=True) * 100
+    payment_pct = pd.DataFrame(shares, index=payment_yearly.index, columns=payment_yearly.columns)
     
-    fig, axes = plt.subplots(1, 2, figsize=(16, 5))
+    fig, axes = plt.subplots(1, 2, figsize=(16, 5), layout='constrained')
     
     # Stacked area chart
     ax1 = axes[0]
-    ax1.stackplot(payment_pct.index, payment_pct.T, alpha=0.8, labels=payment_pct.columns)
+    ax1.stackplot(payment_pct.index.to_numpy(), shares.T, alpha=0.8, labels=payment_pct.columns.tolist())
     ax1.set_xlabel('Year', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Market Share (%)', fontsize=12, fontweight='bold')
     ax1.set_title('Q4: Payment Method Evolution (2015-2025)', fontsize=14, fontweight='bold')
@@ -30,16 +141,16 @@ def payment_evolution_analysis(df):
     
     # Transaction count by payment method
     ax2 = axes[1]
-    payment_total = df.groupby('payment_method').size().sort_values(ascending=False)
+    payment_total = df['payment_method'].value_counts()
+    payment_total = payment_total[payment_total > 0]
     colors = plt.cm.Set3(np.linspace(0, 1, len(payment_total)))
-    ax2.barh(range(len(payment_total)), payment_total.values/1000, color=colors)
+    ax2.barh(range(len(payment_total)), payment_total.to_numpy()/1000, color=colors)
     ax2.set_yticks(range(len(payment_total)))
     ax2.set_yticklabels(payment_total.index)
     ax2.set_xlabel('Transaction Count (Thousands)', fontsize=12, fontweight='bold')
     ax2.set_title('Total Transactions by Payment Method', fontsize=14, fontweight='bold')
     ax2.grid(axis='x', alpha=0.3)
     
-    plt.tight_layout()
     return {
         'figure': fig,
         'payment_evolution': payment_pct,
@@ -47,30 +158,37 @@ def payment_evolution_analysis(df):
     }
 
 
+@disk_cached
 def category_performance_analysis(df):
     """Question 5: Category-wise performance analysis"""
-    category_perf = df.groupby('category').agg({
-        'final_amount_inr': ['sum', 'mean', 'count'],
-        'customer_rating': 'mean',
-        'transaction_id': 'count'
-    }).round(2)
+    prepare_df(df)
+
+    category_perf = df.groupby('category', observed=True).agg(
+        revenue=('final_amount_inr', 'sum'),
+        avg_value=('final_amount_inr', 'mean'),
+        items_sold=('final_amount_inr', 'count'),
+        rating=('customer_rating', 'mean'),
+        transactions=('transaction_id', 'count')
+    ).round(2)
     
-    category_perf.columns = ['revenue', 'avg_value', 'items_sold', 'rating', 'transactions']
     category_perf = category_perf.sort_values('revenue', ascending=False)
     category_perf['market_share'] = (category_perf['revenue'] / category_perf['revenue'].sum()) * 100
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    revenue = category_perf['revenue'].to_numpy()
+    revenue_m = revenue/1_000_000
+    
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
     
     # Revenue pie chart
     ax1 = axes[0, 0]
     colors = plt.cm.Set3(np.linspace(0, 1, len(category_perf)))
-    wedges, texts, autotexts = ax1.pie(category_perf['revenue'], labels=category_perf.index,
+    wedges, texts, autotexts = ax1.pie(revenue, labels=category_perf.index,
                                         autopct='%1.1f%%', colors=colors, startangle=90)
     ax1.set_title('Q5.1: Category Revenue Distribution', fontsize=14, fontweight='bold')
     
     # Revenue bar chart
     ax2 = axes[0, 1]
-    ax2.barh(range(len(category_perf)), category_perf['revenue']/1_000_000, color=colors)
+    ax2.barh(range(len(category_perf)), revenue_m, color=colors)
     ax2.set_yticks(range(len(category_perf)))
     ax2.set_yticklabels(category_perf.index)
     ax2.set_xlabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
@@ -79,7 +197,8 @@ def category_performance_analysis(df):
     
     # Items sold
     ax3 = axes[1, 0]
-    ax3.bar(range(len(category_perf)), category_perf['items_sold']/1000, color=colors, alpha=0.8)
+    items_sold = category_perf['items_sold'].to_numpy()
+    ax3.bar(range(len(category_perf)), items_sold/1000, color=colors, alpha=0.8)
     ax3.set_xticks(range(len(category_perf)))
     ax3.set_xticklabels(category_perf.index, rotation=45, ha='right')
     ax3.set_ylabel('Items Sold (Thousands)', fontsize=12, fontweight='bold')
@@ -88,60 +207,62 @@ def category_performance_analysis(df):
     
     # Average rating
     ax4 = axes[1, 1]
-    ax4.scatter(category_perf['revenue']/1_000_000, category_perf['rating'], 
-               s=category_perf['items_sold']/100, alpha=0.6, c=range(len(category_perf)), 
+    ratings = category_perf['rating'].to_numpy()
+    ax4.scatter(revenue_m, ratings, s=items_sold/100, alpha=0.6, c=range(len(category_perf)), 
                cmap='viridis')
-    for idx, row in category_perf.iterrows():
-        ax4.annotate(idx, (row['revenue']/1_000_000, row['rating']), 
-                    fontsize=9, ha='center')
+    for name, rev, rating in zip(category_perf.index, revenue_m, ratings):
+        ax4.annotate(name, (rev, rating), fontsize=9, ha='center')
     ax4.set_xlabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
     ax4.set_ylabel('Average Rating', fontsize=12, fontweight='bold')
     ax4.set_title('Revenue vs Rating (Size: Sales Volume)', fontsize=14, fontweight='bold')
     ax4.grid(alpha=0.3)
     
-    plt.tight_layout()
     return {
         'figure': fig,
         'category_perf': category_perf
     }
 
 
+@disk_cached
 def prime_impact_analysis(df):
     """Question 6: Prime membership impact analysis"""
-    prime_comparison = df.groupby('is_prime_member').agg({
-        'final_amount_inr': ['mean', 'sum', 'count'],
-        'customer_id': 'nunique',
-        'transaction_id': 'count',
-        'customer_rating': 'mean',
-        'category': lambda x: x.nunique()
-    }).round(2)
-    
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    prepare_df(df)
+
+    prime_stats = df.groupby('is_prime_member', observed=True).agg(
+        aov=('final_amount_inr', 'mean'),
+        revenue=('final_amount_inr', 'sum'),
+        transactions=('transaction_id', 'count'),
+        rating=('customer_rating', 'mean'),
+        rating_std=('customer_rating', 'std'),
+        categories=('category', 'nunique')
+    )
+    prime_stats.insert(3, 'unique_customers', _nunique_by(df['is_prime_member'], df['customer_id']))
+    prime_stats['purchase_frequency'] = prime_stats['transactions'] / prime_stats['unique_customers']
+    prime_comparison = prime_stats.round(2)
+    
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
     
     # Average order value
     ax1 = axes[0, 0]
-    prime_groups = df.groupby('is_prime_member').agg({
-        'final_amount_inr': 'mean',
-        'customer_id': 'count'
-    })
     colors_prime = ['#FF9999', '#66B2FF']
-    ax1.bar(['Non-Prime', 'Prime'], prime_groups['final_amount_inr'].values, color=colors_prime, alpha=0.8)
+    ax1.bar(['Non-Prime', 'Prime'], prime_stats['aov'].values, color=colors_prime, alpha=0.8)
     ax1.set_ylabel('Average Order Value (INR)', fontsize=12, fontweight='bold')
     ax1.set_title('Q6.1: AOV Comparison: Prime vs Non-Prime', fontsize=14, fontweight='bold')
     ax1.grid(axis='y', alpha=0.3)
     
     # Order frequency
     ax2 = axes[0, 1]
-    freq_prime = df.groupby(['customer_id', 'is_prime_member']).size().groupby(level=1).mean()
-    ax2.bar(['Non-Prime', 'Prime'], freq_prime.values, color=colors_prime, alpha=0.8)
+    ax2.bar(['Non-Prime', 'Prime'], prime_stats['purchase_frequency'].values, color=colors_prime, alpha=0.8)
     ax2.set_ylabel('Average Purchases per Customer', fontsize=12, fontweight='bold')
     ax2.set_title('Q6.2: Purchase Frequency Comparison', fontsize=14, fontweight='bold')
     ax2.grid(axis='y', alpha=0.3)
     
     # Category preferences
     ax3 = axes[1, 0]
-    cat_prime = df.groupby(['is_prime_member', 'category']).size().unstack(fill_value=0)
-    cat_prime_pct = cat_prime.div(cat_prime.sum(axis=1), axis=0) * 100
+    cat_prime = pd.crosstab(df['is_prime_member'], df['category'])
+    cat_counts = cat_prime.to_numpy()
+    cat_prime_pct = pd.DataFrame(cat_counts / cat_counts.sum(axis=1, keepdims=True) * 100,
+                                 index=cat_prime.index, columns=cat_prime.columns)
     x = np.arange(len(cat_prime_pct.columns))
     width = 0.35
     ax3.bar(x - width/2, cat_prime_pct.iloc[0].values, width, label='Non-Prime', alpha=0.8)
@@ -155,38 +276,37 @@ def prime_impact_analysis(df):
     
     # Customer satisfaction
     ax4 = axes[1, 1]
-    satisfaction = df.groupby('is_prime_member')['customer_rating'].agg(['mean', 'std'])
-    ax4.bar(['Non-Prime', 'Prime'], satisfaction['mean'].values, 
-           yerr=satisfaction['std'].values, color=colors_prime, alpha=0.8, capsize=5)
+    ax4.bar(['Non-Prime', 'Prime'], prime_stats['rating'].values, 
+           yerr=prime_stats['rating_std'].values, color=colors_prime, alpha=0.8, capsize=5)
     ax4.set_ylabel('Average Rating', fontsize=12, fontweight='bold')
     ax4.set_title('Q6.4: Customer Satisfaction Comparison', fontsize=14, fontweight='bold')
     ax4.set_ylim([0, 5])
     ax4.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
     return {
         'figure': fig,
         'prime_comparison': prime_comparison
     }
 
 
+@disk_cached
 def geographic_analysis(df):
     """Question 7: Geographic sales performance with tier-wise analysis and revenue density"""
+    prepare_df(df)
     
     # ============ PART 1: STATE-LEVEL ANALYSIS ============
-    geo_perf = df.groupby('customer_state').agg({
-        'final_amount_inr': ['sum', 'mean', 'count'],
-        'customer_id': 'nunique'
-    }).round(2)
-    
-    geo_perf.columns = ['revenue', 'avg_value', 'transactions', 'unique_customers']
-    geo_perf = geo_perf.sort_values('revenue', ascending=False)
+    geo_perf = df.groupby('customer_state', observed=True).agg(
+        revenue=('final_amount_inr', 'sum'),
+        avg_value=('final_amount_inr', 'mean'),
+        transactions=('final_amount_inr', 'count')
+    ).round(2)
+    geo_perf['unique_customers'] = _nunique_by(df['customer_state'], df['customer_id'])
     
     # Add revenue density (revenue per customer)
     geo_perf['revenue_density'] = (geo_perf['revenue'] / geo_perf['unique_customers']).round(2)
     geo_perf['revenue_per_transaction'] = (geo_perf['revenue'] / geo_perf['transactions']).round(2)
     
-    geo_perf_top15 = geo_perf.head(15)
+    geo_perf_top15 = geo_perf.nlargest(15, 'revenue')
     
     # ============ PART 2: TIER CLASSIFICATION ============
     metro_cities = ['Maharashtra', 'Delhi', 'Karnataka', 'Tamil Nadu', 'West Bengal', 
@@ -195,20 +315,14 @@ def geographic_analysis(df):
     tier2_cities = ['Jharkhand', 'Chhattisgarh', 'Odisha', 'Assam', 'Bihar', 
                     'Uttarakhand', 'Himachal Pradesh']
     
-    def classify_tier(state):
-        if state in metro_cities:
-            return 'Metro'
-        elif state in tier1_cities:
-            return 'Tier-1'
-        elif state in tier2_cities:
-            return 'Tier-2'
-        else:
-            return 'Rural'
+    tier_map = {state: 'Metro' for state in metro_cities}
+    tier_map.update({state: 'Tier-1' for state in tier1_cities})
+    tier_map.update({state: 'Tier-2' for state in tier2_cities})
     
-    geo_perf['tier'] = geo_perf.index.map(classify_tier)
+    geo_perf['tier'] = pd.Categorical(geo_perf.index.astype(object).map(tier_map).fillna('Rural'))
     
     # Tier-wise aggregation
-    tier_analysis = geo_perf.groupby('tier').agg({
+    tier_analysis = geo_perf.groupby('tier', observed=True).agg({
         'revenue': 'sum',
         'transactions': 'sum',
         'unique_customers': 'sum',
@@ -225,8 +339,8 @@ def geographic_analysis(df):
     tier_analysis = tier_analysis.join(tier_growth.set_index('tier')['growth_rate'], 
                                        how='left')
     
-    fig = plt.figure(figsize=(18, 14))
-    gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
+    fig = plt.figure(figsize=(18, 14), layout='constrained')
+    gs = fig.add_gridspec(3, 2)
     
     # ============ CHART 1: Top 15 States by Revenue ============
     ax1 = fig.add_subplot(gs[0, 0])
@@ -239,9 +353,9 @@ def geographic_analysis(df):
     ax1.grid(axis='x', alpha=0.3)
     
     # Add value labels on bars
-    for i, (idx, row) in enumerate(geo_perf_top15.iterrows()):
-        ax1.text(row['revenue']/1_000_000 + 0.1, i, f"₹{row['revenue']/1_000_000:.1f}M", 
-                va='center', fontsize=9)
+    top15_rev_m = geo_perf_top15['revenue'].to_numpy()/1_000_000
+    for i, rev in enumerate(top15_rev_m):
+        ax1.text(rev + 0.1, i, f"₹{rev:.1f}M", va='center', fontsize=9)
     
     # ============ CHART 2: Revenue Density Heatmap (Choropleth Style) ============
     ax2 = fig.add_subplot(gs[0, 1])
@@ -255,9 +369,8 @@ def geographic_analysis(df):
     ax2.grid(axis='x', alpha=0.3)
     
     # Add value labels
-    for i, (idx, row) in enumerate(density_top.iterrows()):
-        ax2.text(row['revenue_density'] + 50, i, f"₹{row['revenue_density']:.0f}", 
-                va='center', fontsize=9)
+    for i, density in enumerate(density_top['revenue_density'].to_numpy()):
+        ax2.text(density + 50, i, f"₹{density:.0f}", va='center', fontsize=9)
     
     # ============ CHART 3: Tier-wise Revenue Distribution ============
     ax3 = fig.add_subplot(gs[1, 0])
@@ -303,9 +416,8 @@ def geographic_analysis(df):
                          alpha=0.6, c=range(len(geo_perf_top15)), 
                          cmap='plasma', edgecolors='black', linewidth=0.5)
     
-    for idx, row in geo_perf_top15.iterrows():
-        ax5.annotate(idx, (row['transactions'], row['revenue']/1_000_000), 
-                    fontsize=8, ha='center', fontweight='bold')
+    for name, txns, rev in zip(geo_perf_top15.index, geo_perf_top15['transactions'].to_numpy(), top15_rev_m):
+        ax5.annotate(name, (txns, rev), fontsize=8, ha='center', fontweight='bold')
     
     ax5.set_xlabel('Transaction Count', fontsize=11, fontweight='bold')
     ax5.set_ylabel('Revenue (Million INR)', fontsize=11, fontweight='bold')
@@ -331,7 +443,7 @@ def geographic_analysis(df):
                 ha='center', va='bottom', fontweight='bold', fontsize=10)
     
     plt.suptitle('🗺️ Q7: Geographic Sales Performance & Revenue Density Analysis (India)', 
-                fontsize=16, fontweight='bold', y=0.995)
+                fontsize=16, fontweight='bold')
     
     return {
         'figure': fig,
@@ -341,11 +453,12 @@ def geographic_analysis(df):
     }
 
 
+@disk_cached
 def festival_impact_analysis(df):
     """Question 8: Festival sales impact analysis"""
-    df['order_date'] = pd.to_datetime(df['order_date'])
+    prepare_df(df)
     
-    festival_perf = df.groupby('festival_name').agg({
+    festival_perf = df.groupby('festival_name', observed=True).agg({
         'final_amount_inr': ['sum', 'mean', 'count'],
         'transaction_id': 'count',
         'customer_rating': 'mean'
@@ -354,7 +467,7 @@ def festival_impact_analysis(df):
     festival_perf.columns = ['revenue', 'avg_value', 'items', 'transactions', 'rating']
     festival_perf = festival_perf.sort_values('revenue', ascending=False)
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
     
     # Festival revenue
     ax1 = axes[0, 0]
@@ -368,8 +481,8 @@ def festival_impact_analysis(df):
     
     # Non-festival vs festival comparison
     ax2 = axes[0, 1]
-    non_fest = df[~df['is_festival_sale']]['final_amount_inr'].sum()
-    fest = df[df['is_festival_sale']]['final_amount_inr'].sum()
+    non_fest, fest = np.bincount(df['is_festival_sale'].to_numpy(dtype=np.int8),
+                                 weights=df['final_amount_inr'].fillna(0).to_numpy(), minlength=2)
     ax2.pie([non_fest, fest], labels=['Non-Festival', 'Festival'], autopct='%1.1f%%',
            colors=['#FFB6C6', '#FF69B4'], startangle=90)
     ax2.set_title('Q8.2: Festival vs Non-Festival Revenue', fontsize=14, fontweight='bold')
@@ -392,29 +505,32 @@ def festival_impact_analysis(df):
     ax4.set_title('Q8.4: Transaction Volume by Festival', fontsize=14, fontweight='bold')
     ax4.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
     return {
         'figure': fig,
         'festival_perf': festival_perf
     }
 
 
+@disk_cached
 def price_demand_analysis(df):
     """Question 10: Price vs demand analysis"""
+    prepare_df(df)
+
     # Create price bins and analyze demand
-    df['price_bin'] = pd.cut(df['original_price_inr'], bins=10)
-    
-    price_demand = df.groupby(df['price_bin'].apply(lambda x: f"₹{int(x.left)}-{int(x.right)}" 
-                             if pd.notna(x) else 'Unknown')).agg({
-        'transaction_id': 'count',
-        'final_amount_inr': 'mean',
-        'customer_rating': 'mean',
-        'discount_percent': 'mean'
-    }).round(2)
+    price = df['original_price_inr'].to_numpy()
+    edges = np.linspace(np.nanmin(price), np.nanmax(price), 11)
+    codes = np.where(np.isnan(price), -1, np.digitize(price, edges[1:-1]))
+    labels = [f"₹{int(edges[i])}-{int(edges[i + 1])}" for i in range(10)]
     
-    price_demand.columns = ['quantity', 'avg_value', 'rating', 'discount']
+    price_demand = pd.DataFrame({
+        'quantity': _bin_count(codes, df['transaction_id'], 10),
+        'avg_value': _bin_mean(codes, df['final_amount_inr'], 10),
+        'rating': _bin_mean(codes, df['customer_rating'], 10),
+        'discount': _bin_mean(codes, df['discount_percent'], 10)
+    }, index=pd.Index(labels, name='price_bin')).round(2)
+    price_demand = price_demand[price_demand['quantity'] > 0]
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
     
     # Price vs quantity
     ax1 = axes[0, 0]
@@ -457,8 +573,38 @@ def price_demand_analysis(df):
     ax4.set_title('Q10.4: Average Discount by Price Range', fontsize=14, fontweight='bold')
     ax4.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
     return {
         'figure': fig,
         'price_demand': price_demand
     }
+
+
+ANALYSES = {
+    'payment_evolution': payment_evolution_analysis,
+    'category_performance': category_performance_analysis,
+    'prime_impact': prime_impact_analysis,
+    'geographic': geographic_analysis,
+    'festival_impact': festival_impact_analysis,
+    'price_demand': price_demand_analysis
+}
+
+_worker_df = None
+
+
+def _init_worker(df):
+    """Receive the shared frame once per worker process and render headless"""
+    global _worker_df
+    matplotlib.use('Agg')
+    _worker_df = df
+
+
+def _run_analysis(name):
+    return name, ANALYSES[name](_worker_df)
+
+
+def run_all_analyses(df, max_workers=None):
+    """Run the six independent analyses in parallel worker processes"""
+    prepare_df(df)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(df,)) as pool:
+        return dict(pool.map(_run_analysis, ANALYSES))
@@ -6,29 +6,156 @@ discounts, ratings, customer journey, inventory, pricing, and business health.
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 
+from eda.analysis_helpers import ensure_categorical, memoized, shrink
 
-def age_group_analysis(df):
-    """Question 9: Customer age group behavior and preferences"""
-    age_perf = df.groupby('customer_age_group').agg({
-        'final_amount_inr': ['sum', 'mean', 'count'],
-        'customer_id': 'nunique',
-        'customer_rating': 'mean',
-        'quantity': 'mean'
-    }).round(2)
+
+# Numeric columns the Q9-Q20 analyses downcast before aggregating
+_SHRINK_COLUMNS = ('final_amount_inr', 'original_price_inr', 'discount_percent', 'customer_rating',
+                   'product_rating', 'delivery_days', 'quantity', 'order_year')
+
+
+def _group_rate(keys, mask):
+    """Percentage of True in mask per category of keys, via bincount on the category codes"""
+    codes = keys.cat.codes.to_numpy()
+    valid = codes >= 0
+    n_cats = len(keys.cat.categories)
+    hits = np.bincount(codes[valid], weights=mask.to_numpy(dtype=bool)[valid], minlength=n_cats)
+    totals = np.bincount(codes[valid], minlength=n_cats)
+    present = totals > 0
+    index = pd.CategoricalIndex(keys.cat.categories[present], categories=keys.cat.categories,
+                                ordered=keys.cat.ordered, name=keys.name)
+    return pd.Series(hits[present] / totals[present] * 100, index=index)
+
+
+def _group_median(keys, values):
+    """NaN-skipping median of values per category code, broadcast back to rows (NaN for missing keys)"""
+    codes = keys.cat.codes.to_numpy()
+    values = values.to_numpy(dtype=np.float64)
+    n_cats = len(keys.cat.categories)
+    valid = (codes >= 0) & ~np.isnan(values)
+    order = np.argsort(codes[valid], kind='stable')
+    sorted_codes, sorted_values = codes[valid][order], values[valid][order]
+    bounds = np.searchsorted(sorted_codes, np.arange(n_cats + 1))
+    medians = np.full(n_cats + 1, np.nan)
+    for code in range(n_cats):
+        lo, hi = bounds[code], bounds[code + 1]
+        if hi > lo:
+            segment = sorted_values[lo:hi]
+            mid = (hi - lo) // 2
+            segment.partition(mid)
+            medians[code] = segment[mid] if (hi - lo) % 2 else (segment[mid] + segment[:mid].max()) / 2
+    return medians[codes]
+
+
+def _cat_sum(keys, values):
+    """Sum of values per observed category of keys, via bincount on the category codes"""
+    codes = keys.cat.codes.to_numpy()
+    valid = codes >= 0
+    n_cats = len(keys.cat.categories)
+    weights = np.nan_to_num(values.to_numpy(dtype=np.float64)[valid])
+    sums = np.bincount(codes[valid], weights=weights, minlength=n_cats)
+    present = np.bincount(codes[valid], minlength=n_cats) > 0
+    index = pd.CategoricalIndex(keys.cat.categories[present], categories=keys.cat.categories,
+                                ordered=keys.cat.ordered, name=keys.name)
+    return pd.Series(sums[present], index=index, name=values.name)
+
+
+def _binned_stats(x, bins, label, **aggs):
+    """Equivalent of groupby(pd.cut(x, bins), observed=True).agg(...) using bincount on bin codes.
+
+    bins is an edge list or a number of equal-width bins (right-closed, as in pd.cut); label
+    formats a (left, right) edge pair; each agg is name=(Series, 'count' | 'sum' | 'mean').
+    Rows are labelled with the formatted edges and empty bins are dropped.
+    """
+    values = x.to_numpy()
+    if values.dtype.kind != 'f':
+        values = values.astype(np.float64)
+    if np.ndim(bins) == 0:
+        # Edges in the column's own precision so values on an edge bin as they do in pd.cut
+        low, high = np.nanmin(values), np.nanmax(values)
+        edges = np.linspace(low, high, bins + 1, dtype=values.dtype)
+        edges[0] -= (high - low) * 0.001
+    else:
+        edges = np.asarray(bins, dtype=np.float64)
+    n_bins = len(edges) - 1
+    codes = np.searchsorted(edges, values, side='left') - 1
+    valid = (codes >= 0) & (codes < n_bins)
+    codes = codes[valid]
+    
+    stats = {}
+    for name, (col, how) in aggs.items():
+        if how == 'count':
+            stats[name] = np.bincount(codes[col.notna().to_numpy()[valid]], minlength=n_bins)
+            continue
+        col_values = col.to_numpy(dtype=np.float64)[valid]
+        seen = ~np.isnan(col_values)
+        sums = np.bincount(codes[seen], weights=col_values[seen], minlength=n_bins)
+        if how == 'sum':
+            stats[name] = sums
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stats[name] = sums / np.bincount(codes[seen], minlength=n_bins)
+    
+    labels = [label(edges[i], edges[i + 1]) for i in range(n_bins)]
+    stats = pd.DataFrame(stats, index=pd.Index(labels, name=x.name))
+    return stats[np.bincount(codes, minlength=n_bins) > 0]
+
+
+def _brand_stats(df):
+    """Per-brand revenue, AOV, volume and ratings, shared by Q13 and Q20"""
+    ensure_categorical(df, ['brand'])
+    return memoized(df, 'brand_stats', lambda: df.groupby('brand', observed=True, sort=False).agg(
+        revenue=('final_amount_inr', 'sum'),
+        aov=('final_amount_inr', 'mean'),
+        transactions=('final_amount_inr', 'count'),
+        cust_rating=('customer_rating', 'mean'),
+        prod_rating=('product_rating', 'mean')
+    ), columns=['brand', 'final_amount_inr', 'customer_rating', 'product_rating'])
+
+
+def _compute_age_group(df):
+    """Aggregations behind the Q9 age group analysis"""
+    shrink(df, _SHRINK_COLUMNS)
+    ensure_categorical(df, ['customer_age_group', 'category'])
+    age_perf = df.groupby('customer_age_group', observed=True).agg(
+        revenue=('final_amount_inr', 'sum'),
+        aov=('final_amount_inr', 'mean'),
+        transactions=('final_amount_inr', 'count'),
+        unique_customers=('customer_id', 'nunique'),
+        rating=('customer_rating', 'mean'),
+        avg_qty=('quantity', 'mean')
+    ).round(2)
     
-    age_perf.columns = ['revenue', 'aov', 'transactions', 'unique_customers', 'rating', 'avg_qty']
     age_order = ['13-18', '19-25', '26-35', '36-45', '46-55', '56+']
     age_perf = age_perf.reindex([x for x in age_order if x in age_perf.index])
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    cat_age = df.groupby(['customer_age_group', 'category'], observed=True).size().unstack(fill_value=0)
+    cat_age_pct = cat_age.div(cat_age.sum(axis=1), axis=0) * 100
+    cat_age_pct = cat_age_pct.reindex([x for x in age_order if x in cat_age_pct.index])
+    
+    return {
+        'age_perf': age_perf,
+        'category_age': cat_age_pct
+    }
+
+
+def _plot_age_group(data):
+    """Figure for the Q9 age group analysis"""
+    age_perf = data['age_perf']
+    cat_age_pct = data['category_age']
+    
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     
     # Revenue by age group
     ax1 = axes[0, 0]
     colors_age = plt.cm.viridis(np.linspace(0, 1, len(age_perf)))
-    ax1.bar(range(len(age_perf)), age_perf['revenue']/1_000_000, color=colors_age, alpha=0.8)
-    ax1.set_xticks(range(len(age_perf)))
+    age_pos = np.arange(len(age_perf))
+    ax1.bar(age_pos, age_perf['revenue']/1_000_000, color=colors_age, alpha=0.8)
+    ax1.set_xticks(age_pos)
     ax1.set_xticklabels(age_perf.index, rotation=0)
     ax1.set_ylabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
     ax1.set_title('Q9.1: Revenue by Age Group', fontsize=14, fontweight='bold')
@@ -36,20 +163,16 @@ def age_group_analysis(df):
     
     # AOV by age
     ax2 = axes[0, 1]
-    ax2.plot(range(len(age_perf)), age_perf['aov'], marker='o', linewidth=2.5, 
+    ax2.plot(age_pos, age_perf['aov'], marker='o', linewidth=2.5, 
             markersize=10, color='darkred')
-    ax2.fill_between(range(len(age_perf)), age_perf['aov'], alpha=0.3, color='red')
-    ax2.set_xticks(range(len(age_perf)))
+    ax2.fill_between(age_pos, age_perf['aov'], alpha=0.3, color='red')
+    ax2.set_xticks(age_pos)
     ax2.set_xticklabels(age_perf.index, rotation=0)
     ax2.set_ylabel('Average Order Value (INR)', fontsize=12, fontweight='bold')
     ax2.set_title('Q9.2: AOV by Age Group', fontsize=14, fontweight='bold')
     ax2.grid(alpha=0.3)
     
     # Category preferences
-    cat_age = df.groupby(['customer_age_group', 'category']).size().unstack(fill_value=0)
-    cat_age_pct = cat_age.div(cat_age.sum(axis=1), axis=0) * 100
-    cat_age_pct = cat_age_pct.reindex([x for x in age_order if x in cat_age_pct.index])
-    
     ax3 = axes[1, 0]
     cat_age_pct.plot(kind='bar', stacked=False, ax=ax3, width=0.8)
     ax3.set_xlabel('Age Group', fontsize=12, fontweight='bold')
@@ -57,60 +180,94 @@ def age_group_analysis(df):
     ax3.set_title('Q9.3: Category Preferences by Age', fontsize=14, fontweight='bold')
     ax3.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=9)
     ax3.grid(axis='y', alpha=0.3)
-    plt.setp(ax3.xaxis.get_majorticklabels(), rotation=0)
+    ax3.tick_params(axis='x', labelrotation=0)
     
     # Customer satisfaction
     ax4 = axes[1, 1]
-    ax4.bar(range(len(age_perf)), age_perf['rating'], color=colors_age, alpha=0.8)
-    ax4.set_xticks(range(len(age_perf)))
+    ax4.bar(age_pos, age_perf['rating'], color=colors_age, alpha=0.8)
+    ax4.set_xticks(age_pos)
     ax4.set_xticklabels(age_perf.index, rotation=0)
     ax4.set_ylabel('Average Rating', fontsize=12, fontweight='bold')
     ax4.set_title('Q9.4: Customer Satisfaction by Age', fontsize=14, fontweight='bold')
     ax4.set_ylim([0, 5])
     ax4.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+
+def age_group_analysis(df):
+    """Question 9: Customer age group behavior and preferences"""
+    data = _compute_age_group(df)
     return {
-        'figure': fig,
-        'age_perf': age_perf,
-        'category_age': cat_age_pct
+        'figure': _plot_age_group(data),
+        'age_perf': data['age_perf'],
+        'category_age': data['category_age']
     }
 
 
-def delivery_performance_analysis(df):
-    """Question 11: Delivery performance and satisfaction analysis"""
-    delivery_perf = df.groupby('delivery_type').agg({
-        'delivery_days': ['mean', 'median', 'std'],
-        'final_amount_inr': 'mean',
-        'customer_rating': 'mean',
-        'transaction_id': 'count'
+def _compute_delivery(df):
+    """Aggregations behind the Q11 delivery analysis"""
+    shrink(df, _SHRINK_COLUMNS)
+    ensure_categorical(df, ['delivery_type', 'customer_state'])
+    delivery_perf = df.groupby('delivery_type', observed=True).agg(
+        avg_days=('delivery_days', 'mean'),
+        median_days=('delivery_days', 'median'),
+        std_days=('delivery_days', 'std'),
+        aov=('final_amount_inr', 'mean'),
+        rating=('customer_rating', 'mean'),
+        count=('transaction_id', 'count')
+    ).round(2)
+    
+    days_by_type = {dt: days.to_numpy() for dt, days in
+                    df['delivery_days'].dropna().groupby(df['delivery_type'], observed=True, sort=False)}
+    
+    type_median = _group_median(df['delivery_type'], df['delivery_days'])
+    on_time_analysis = pd.DataFrame({
+        'delivery_days': _group_rate(df['delivery_type'], df['delivery_days'] <= type_median),
+        'customer_rating': delivery_perf['rating']
     }).round(2)
     
-    delivery_perf.columns = ['avg_days', 'median_days', 'std_days', 'aov', 'rating', 'count']
+    geo_delivery = df.groupby('customer_state', observed=True)['delivery_days'].mean().nlargest(10)
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    delivery_by_price = _binned_stats(df['original_price_inr'], 5, lambda lo, hi: f"₹{int(lo)}-{int(hi)}",
+                                      delivery_days=(df['delivery_days'], 'mean'))['delivery_days']
+    
+    return {
+        'delivery_perf': delivery_perf,
+        'days_by_type': days_by_type,
+        'on_time': on_time_analysis,
+        'slowest_states': geo_delivery,
+        'days_by_price': delivery_by_price
+    }
+
+
+def _plot_delivery(data):
+    """Figure for the Q11 delivery analysis"""
+    days_by_type = data['days_by_type']
+    on_time_analysis = data['on_time']
+    geo_delivery = data['slowest_states']
+    delivery_by_price = data['days_by_price']
+    
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     
     # Delivery time distribution
     ax1 = axes[0, 0]
-    ax1.boxplot([df[df['delivery_type']==dt]['delivery_days'].dropna() 
-                 for dt in df['delivery_type'].unique() if pd.notna(dt)],
-               labels=[dt for dt in df['delivery_type'].unique() if pd.notna(dt)])
+    ax1.boxplot(list(days_by_type.values()), labels=list(days_by_type))
     ax1.set_ylabel('Delivery Days', fontsize=12, fontweight='bold')
     ax1.set_title('Q11.1: Delivery Time Distribution', fontsize=14, fontweight='bold')
     ax1.grid(axis='y', alpha=0.3)
     
     # On-time delivery vs satisfaction
     ax2 = axes[0, 1]
-    on_time_analysis = df.groupby('delivery_type').agg({
-        'delivery_days': lambda x: (x <= x.median()).sum() / len(x) * 100,
-        'customer_rating': 'mean'
-    }).round(2)
     ax2_2 = ax2.twinx()
-    bars = ax2.bar(range(len(on_time_analysis)), on_time_analysis['delivery_days'], 
+    type_pos = np.arange(len(on_time_analysis))
+    bars = ax2.bar(type_pos, on_time_analysis['delivery_days'], 
                   color='steelblue', alpha=0.7, label='On-Time %')
-    ax2_2.plot(range(len(on_time_analysis)), on_time_analysis['customer_rating'], 
+    ax2_2.plot(type_pos, on_time_analysis['customer_rating'], 
               marker='o', color='red', linewidth=2, markersize=8, label='Avg Rating')
-    ax2.set_xticks(range(len(on_time_analysis)))
+    ax2.set_xticks(type_pos)
     ax2.set_xticklabels(on_time_analysis.index, rotation=45, ha='right')
     ax2.set_ylabel('On-Time Delivery %', fontsize=12, fontweight='bold', color='steelblue')
     ax2_2.set_ylabel('Average Rating', fontsize=12, fontweight='bold', color='red')
@@ -119,10 +276,10 @@ def delivery_performance_analysis(df):
     
     # Geographic delivery performance
     ax3 = axes[1, 0]
-    geo_delivery = df.groupby('customer_state')['delivery_days'].mean().sort_values(ascending=False).head(10)
     colors_del = plt.cm.RdYlGn_r(np.linspace(0.3, 0.9, len(geo_delivery)))
-    ax3.barh(range(len(geo_delivery)), geo_delivery.values, color=colors_del)
-    ax3.set_yticks(range(len(geo_delivery)))
+    state_pos = np.arange(len(geo_delivery))
+    ax3.barh(state_pos, geo_delivery.values, color=colors_del)
+    ax3.set_yticks(state_pos)
     ax3.set_yticklabels(geo_delivery.index)
     ax3.set_xlabel('Average Delivery Days', fontsize=12, fontweight='bold')
     ax3.set_title('Q11.3: Top 10 States with Longest Delivery', fontsize=14, fontweight='bold')
@@ -130,36 +287,68 @@ def delivery_performance_analysis(df):
     
     # Delivery vs price correlation
     ax4 = axes[1, 1]
-    price_bins = pd.cut(df['original_price_inr'], bins=5)
-    delivery_by_price = df.groupby(price_bins)['delivery_days'].mean()
-    ax4.plot(range(len(delivery_by_price)), delivery_by_price.values, marker='s', 
+    price_pos = np.arange(len(delivery_by_price))
+    ax4.plot(price_pos, delivery_by_price.values, marker='s', 
             linewidth=2, markersize=8, color='darkgreen')
-    ax4.set_xticks(range(len(delivery_by_price)))
-    ax4.set_xticklabels([f"₹{int(x.left)}-{int(x.right)}" for x in delivery_by_price.index], rotation=45, ha='right')
+    ax4.set_xticks(price_pos)
+    ax4.set_xticklabels(delivery_by_price.index, rotation=45, ha='right')
     ax4.set_ylabel('Average Delivery Days', fontsize=12, fontweight='bold')
     ax4.set_title('Q11.4: Delivery Time vs Price Range', fontsize=14, fontweight='bold')
     ax4.grid(alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+
+def delivery_performance_analysis(df):
+    """Question 11: Delivery performance and satisfaction analysis"""
+    data = _compute_delivery(df)
     return {
-        'figure': fig,
-        'delivery_perf': delivery_perf
+        'figure': _plot_delivery(data),
+        'delivery_perf': data['delivery_perf']
     }
 
 
-def returns_analysis(df):
-    """Question 12: Return patterns and customer satisfaction"""
-    return_perf = df.groupby('return_status').agg({
+def _compute_returns(df):
+    """Aggregations behind the Q12 returns analysis"""
+    shrink(df, _SHRINK_COLUMNS)
+    ensure_categorical(df, ['return_status', 'category'])
+    return_stats = df.groupby('return_status', observed=True).agg({
         'final_amount_inr': ['sum', 'mean', 'count'],
         'customer_rating': 'mean',
         'product_rating': 'mean'
-    }).round(2)
+    })
+    return_perf = return_stats.round(2)
+    
+    return_counts = df['return_status'].value_counts()
+    returned = df['return_status'].eq('Returned')
+    cat_return_rate = _group_rate(df['category'], returned).sort_values(ascending=False)
+    
+    rating_return = _binned_stats(df['product_rating'], 5, lambda lo, hi: f"{int(lo)}-{int(hi)}",
+                                  return_rate=(returned, 'mean'))['return_rate'] * 100
+    satisfaction = return_stats[('customer_rating', 'mean')]
+    
+    return {
+        'return_perf': return_perf,
+        'return_counts': return_counts,
+        'return_rate_by_category': cat_return_rate,
+        'return_rate_by_rating': rating_return,
+        'satisfaction': satisfaction
+    }
+
+
+def _plot_returns(data):
+    """Figure for the Q12 returns analysis"""
+    return_counts = data['return_counts']
+    cat_return_rate = data['return_rate_by_category']
+    rating_return = data['return_rate_by_rating']
+    satisfaction = data['satisfaction']
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     
     # Return status distribution
     ax1 = axes[0, 0]
-    return_counts = df['return_status'].value_counts()
     colors_ret = ['green', 'red', 'orange']
     ax1.pie(return_counts.values, labels=return_counts.index, autopct='%1.1f%%',
            colors=colors_ret[:len(return_counts)], startangle=90)
@@ -167,13 +356,10 @@ def returns_analysis(df):
     
     # Return rate by category
     ax2 = axes[0, 1]
-    cat_returns = df[df['return_status']=='Returned'].groupby('category').size()
-    cat_total = df.groupby('category').size()
-    cat_return_rate = (cat_returns / cat_total * 100).sort_values(ascending=False)
-    
     colors_cat = plt.cm.Reds(np.linspace(0.4, 0.9, len(cat_return_rate)))
-    ax2.barh(range(len(cat_return_rate)), cat_return_rate.values, color=colors_cat)
-    ax2.set_yticks(range(len(cat_return_rate)))
+    cat_pos = np.arange(len(cat_return_rate))
+    ax2.barh(cat_pos, cat_return_rate.values, color=colors_cat)
+    ax2.set_yticks(cat_pos)
     ax2.set_yticklabels(cat_return_rate.index)
     ax2.set_xlabel('Return Rate (%)', fontsize=12, fontweight='bold')
     ax2.set_title('Q12.2: Return Rate by Category', fontsize=14, fontweight='bold')
@@ -181,55 +367,73 @@ def returns_analysis(df):
     
     # Product rating impact on returns
     ax3 = axes[1, 0]
-    rating_return = df.groupby(pd.cut(df['product_rating'], bins=5))['return_status'].apply(
-        lambda x: (x=='Returned').sum()/len(x)*100)
-    ax3.plot(range(len(rating_return)), rating_return.values, marker='o', 
+    bin_pos = np.arange(len(rating_return))
+    ax3.plot(bin_pos, rating_return.values, marker='o', 
             linewidth=2, markersize=8, color='darkblue')
-    ax3.fill_between(range(len(rating_return)), rating_return.values, alpha=0.3)
-    ax3.set_xticks(range(len(rating_return)))
-    ax3.set_xticklabels([f"{int(x.left)}-{int(x.right)}" for x in rating_return.index], rotation=45, ha='right')
+    ax3.fill_between(bin_pos, rating_return.values, alpha=0.3)
+    ax3.set_xticks(bin_pos)
+    ax3.set_xticklabels(rating_return.index, rotation=45, ha='right')
     ax3.set_ylabel('Return Rate (%)', fontsize=12, fontweight='bold')
     ax3.set_title('Q12.3: Return Rate vs Product Rating', fontsize=14, fontweight='bold')
     ax3.grid(alpha=0.3)
     
     # Satisfaction by return status
     ax4 = axes[1, 1]
-    satisfaction = df.groupby('return_status')['customer_rating'].mean()
     colors_sat = ['green' if x > 3.5 else 'red' for x in satisfaction.values]
-    ax4.bar(range(len(satisfaction)), satisfaction.values, color=colors_sat, alpha=0.8)
-    ax4.set_xticks(range(len(satisfaction)))
+    status_pos = np.arange(len(satisfaction))
+    ax4.bar(status_pos, satisfaction.values, color=colors_sat, alpha=0.8)
+    ax4.set_xticks(status_pos)
     ax4.set_xticklabels(satisfaction.index, rotation=45, ha='right')
     ax4.set_ylabel('Average Customer Rating', fontsize=12, fontweight='bold')
     ax4.set_title('Q12.4: Satisfaction by Return Status', fontsize=14, fontweight='bold')
     ax4.set_ylim([0, 5])
     ax4.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+
+def returns_analysis(df):
+    """Question 12: Return patterns and customer satisfaction"""
+    data = _compute_returns(df)
     return {
-        'figure': fig,
-        'return_perf': return_perf,
-        'return_rate_by_category': cat_return_rate
+        'figure': _plot_returns(data),
+        'return_perf': data['return_perf'],
+        'return_rate_by_category': data['return_rate_by_category']
     }
 
 
-def brand_analysis(df):
-    """Question 13: Brand performance and market share evolution"""
-    brand_perf = df.groupby('brand').agg({
-        'final_amount_inr': ['sum', 'mean', 'count'],
-        'customer_rating': 'mean',
-        'product_rating': 'mean'
-    }).round(2)
+def _compute_brand(df):
+    """Aggregations behind the Q13 brand analysis"""
+    shrink(df, _SHRINK_COLUMNS)
+    brand_stats = _brand_stats(df)
+    top_revenue = brand_stats['revenue'].nlargest(15)
+    brand_perf = brand_stats.loc[top_revenue.index].round(2)
+    
+    top_brands = top_revenue.head(10)
+    other = brand_stats['revenue'].sum() - top_brands.sum()
+    plot_data = pd.concat([top_brands, pd.Series({'Others': other})])
     
-    brand_perf.columns = ['revenue', 'aov', 'transactions', 'cust_rating', 'prod_rating']
-    brand_perf = brand_perf.sort_values('revenue', ascending=False).head(15)
+    return {
+        'brand_perf': brand_perf,
+        'market_share': plot_data
+    }
+
+
+def _plot_brand(data):
+    """Figure for the Q13 brand analysis"""
+    brand_perf = data['brand_perf']
+    plot_data = data['market_share']
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     
     # Top brands by revenue
     ax1 = axes[0, 0]
     colors_brand = plt.cm.tab20(np.linspace(0, 1, len(brand_perf)))
-    ax1.barh(range(len(brand_perf)), brand_perf['revenue']/1_000_000, color=colors_brand)
-    ax1.set_yticks(range(len(brand_perf)))
+    brand_pos = np.arange(len(brand_perf))
+    ax1.barh(brand_pos, brand_perf['revenue']/1_000_000, color=colors_brand)
+    ax1.set_yticks(brand_pos)
     ax1.set_yticklabels(brand_perf.index, fontsize=9)
     ax1.set_xlabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
     ax1.set_title('Q13.1: Top 15 Brands by Revenue', fontsize=14, fontweight='bold')
@@ -237,21 +441,18 @@ def brand_analysis(df):
     
     # Market share
     ax2 = axes[0, 1]
-    all_brands = df.groupby('brand')['final_amount_inr'].sum().sort_values(ascending=False)
-    top_brands = all_brands.head(10)
-    other = all_brands[10:].sum()
-    plot_data = pd.concat([top_brands, pd.Series({'Others': other})])
     ax2.pie(plot_data.values, labels=plot_data.index, autopct='%1.1f%%', startangle=90)
     ax2.set_title('Q13.2: Market Share - Top 10 Brands', fontsize=14, fontweight='bold')
     
     # Rating vs revenue scatter
     ax3 = axes[1, 0]
     ax3.scatter(brand_perf['prod_rating'], brand_perf['revenue']/1_000_000, 
-               s=brand_perf['transactions']/10, alpha=0.6, c=range(len(brand_perf)), 
+               s=brand_perf['transactions']/10, alpha=0.6, c=brand_pos, 
                cmap='viridis')
-    for idx, row in brand_perf.head(10).iterrows():
-        ax3.annotate(idx, (row['prod_rating'], row['revenue']/1_000_000), 
-                    fontsize=8, ha='center')
+    top_ten = brand_perf.head(10)
+    for name, rating, revenue in zip(top_ten.index, top_ten['prod_rating'].to_numpy(),
+                                     top_ten['revenue'].to_numpy() / 1_000_000):
+        ax3.annotate(name, (rating, revenue), fontsize=8, ha='center')
     ax3.set_xlabel('Product Rating', fontsize=12, fontweight='bold')
     ax3.set_ylabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
     ax3.set_title('Q13.3: Rating vs Revenue (Size: Volume)', fontsize=14, fontweight='bold')
@@ -259,99 +460,137 @@ def brand_analysis(df):
     
     # AOV by brand
     ax4 = axes[1, 1]
-    ax4.bar(range(len(brand_perf)), brand_perf['aov'], color=colors_brand, alpha=0.8)
-    ax4.set_xticks(range(len(brand_perf)))
+    ax4.bar(brand_pos, brand_perf['aov'], color=colors_brand, alpha=0.8)
+    ax4.set_xticks(brand_pos)
     ax4.set_xticklabels(brand_perf.index, rotation=45, ha='right', fontsize=9)
     ax4.set_ylabel('Average Order Value (INR)', fontsize=12, fontweight='bold')
     ax4.set_title('Q13.4: AOV by Brand', fontsize=14, fontweight='bold')
     ax4.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+
+def brand_analysis(df):
+    """Question 13: Brand performance and market share evolution"""
+    data = _compute_brand(df)
     return {
-        'figure': fig,
-        'brand_perf': brand_perf
+        'figure': _plot_brand(data),
+        'brand_perf': data['brand_perf']
     }
 
 
-def discount_effectiveness_analysis(df):
-    """Question 15: Discount and promotional effectiveness"""
-    discount_bins = pd.cut(df['discount_percent'], bins=[0, 10, 20, 30, 50, 100])
+def _compute_discount(df):
+    """Aggregations behind the Q15 discount analysis"""
+    shrink(df, _SHRINK_COLUMNS)
+    discount_perf = _binned_stats(
+        df['discount_percent'], [0, 10, 20, 30, 50, 100], lambda lo, hi: f"{lo:g}-{hi:g}%",
+        transactions=(df['transaction_id'], 'count'),
+        revenue=(df['final_amount_inr'], 'sum'),
+        aov=(df['final_amount_inr'], 'mean'),
+        rating=(df['customer_rating'], 'mean')
+    ).round(2)
     
-    discount_perf = df.groupby(discount_bins).agg({
-        'transaction_id': 'count',
-        'final_amount_inr': ['sum', 'mean'],
-        'customer_rating': 'mean'
-    }).round(2)
-    
-    discount_perf.columns = ['transactions', 'revenue', 'aov', 'rating']
+    return {
+        'discount_perf': discount_perf
+    }
+
+
+def _plot_discount(data):
+    """Figure for the Q15 discount analysis"""
+    discount_perf = data['discount_perf']
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     
     # Revenue by discount range
     ax1 = axes[0, 0]
     colors_disc = plt.cm.YlGn(np.linspace(0.3, 0.9, len(discount_perf)))
-    ax1.bar(range(len(discount_perf)), discount_perf['revenue']/1_000_000, color=colors_disc, alpha=0.8)
-    ax1.set_xticks(range(len(discount_perf)))
-    ax1.set_xticklabels([f"{int(x.left)}-{int(x.right)}%" for x in discount_perf.index], rotation=0)
+    disc_pos = np.arange(len(discount_perf))
+    ax1.bar(disc_pos, discount_perf['revenue']/1_000_000, color=colors_disc, alpha=0.8)
+    ax1.set_xticks(disc_pos)
+    ax1.set_xticklabels(discount_perf.index, rotation=0)
     ax1.set_ylabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
     ax1.set_title('Q15.1: Revenue by Discount Range', fontsize=14, fontweight='bold')
     ax1.grid(axis='y', alpha=0.3)
     
     # Sales volume by discount
     ax2 = axes[0, 1]
-    ax2.plot(range(len(discount_perf)), discount_perf['transactions']/1000, marker='o', 
+    ax2.plot(disc_pos, discount_perf['transactions']/1000, marker='o', 
             linewidth=2, markersize=8, color='darkblue')
-    ax2.fill_between(range(len(discount_perf)), discount_perf['transactions']/1000, alpha=0.3)
-    ax2.set_xticks(range(len(discount_perf)))
-    ax2.set_xticklabels([f"{int(x.left)}-{int(x.right)}%" for x in discount_perf.index], rotation=0)
+    ax2.fill_between(disc_pos, discount_perf['transactions']/1000, alpha=0.3)
+    ax2.set_xticks(disc_pos)
+    ax2.set_xticklabels(discount_perf.index, rotation=0)
     ax2.set_ylabel('Transaction Volume (Thousands)', fontsize=12, fontweight='bold')
     ax2.set_title('Q15.2: Sales Volume by Discount Range', fontsize=14, fontweight='bold')
     ax2.grid(alpha=0.3)
     
     # AOV impact
     ax3 = axes[1, 0]
-    ax3.bar(range(len(discount_perf)), discount_perf['aov'], color=colors_disc, alpha=0.8)
-    ax3.set_xticks(range(len(discount_perf)))
-    ax3.set_xticklabels([f"{int(x.left)}-{int(x.right)}%" for x in discount_perf.index], rotation=0)
+    ax3.bar(disc_pos, discount_perf['aov'], color=colors_disc, alpha=0.8)
+    ax3.set_xticks(disc_pos)
+    ax3.set_xticklabels(discount_perf.index, rotation=0)
     ax3.set_ylabel('Average Order Value (INR)', fontsize=12, fontweight='bold')
     ax3.set_title('Q15.3: AOV Impact of Discounts', fontsize=14, fontweight='bold')
     ax3.grid(axis='y', alpha=0.3)
     
     # Customer satisfaction
     ax4 = axes[1, 1]
-    ax4.plot(range(len(discount_perf)), discount_perf['rating'], marker='s', 
+    ax4.plot(disc_pos, discount_perf['rating'], marker='s', 
             linewidth=2, markersize=8, color='darkgreen')
-    ax4.set_xticks(range(len(discount_perf)))
-    ax4.set_xticklabels([f"{int(x.left)}-{int(x.right)}%" for x in discount_perf.index], rotation=0)
+    ax4.set_xticks(disc_pos)
+    ax4.set_xticklabels(discount_perf.index, rotation=0)
     ax4.set_ylabel('Average Rating', fontsize=12, fontweight='bold')
     ax4.set_title('Q15.4: Satisfaction vs Discount Level', fontsize=14, fontweight='bold')
     ax4.set_ylim([0, 5])
     ax4.grid(alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+
+def discount_effectiveness_analysis(df):
+    """Question 15: Discount and promotional effectiveness"""
+    data = _compute_discount(df)
     return {
-        'figure': fig,
-        'discount_perf': discount_perf
+        'figure': _plot_discount(data),
+        'discount_perf': data['discount_perf']
     }
 
 
-def rating_impact_analysis(df):
-    """Question 16: Product rating patterns and sales impact"""
-    rating_bins = pd.cut(df['product_rating'], bins=[0, 2, 3, 4, 4.5, 5])
-    
-    rating_perf = df.groupby(rating_bins).agg({
-        'transaction_id': 'count',
-        'final_amount_inr': ['sum', 'mean'],
-        'customer_rating': 'mean'
-    }).round(2)
+def _compute_rating(df):
+    """Aggregations behind the Q16 rating analysis"""
+    shrink(df, _SHRINK_COLUMNS)
+    ensure_categorical(df, ['category'])
+    rating_perf = _binned_stats(
+        df['product_rating'], [0, 2, 3, 4, 4.5, 5], lambda lo, hi: f"{lo:g}-{hi:g}",
+        sales=(df['transaction_id'], 'count'),
+        revenue=(df['final_amount_inr'], 'sum'),
+        aov=(df['final_amount_inr'], 'mean'),
+        cust_rating=(df['customer_rating'], 'mean')
+    ).round(2)
+    product_ratings = df['product_rating'].dropna().to_numpy()
+    cat_ratings = df.groupby('category', observed=True)['product_rating'].mean().sort_values(ascending=False)
     
-    rating_perf.columns = ['sales', 'revenue', 'aov', 'cust_rating']
+    return {
+        'rating_perf': rating_perf,
+        'product_ratings': product_ratings,
+        'category_ratings': cat_ratings
+    }
+
+
+def _plot_rating(data):
+    """Figure for the Q16 rating analysis"""
+    rating_perf = data['rating_perf']
+    product_ratings = data['product_ratings']
+    cat_ratings = data['category_ratings']
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(2, 2)
     
     # Rating distribution
     ax1 = axes[0, 0]
-    ax1.hist(df['product_rating'].dropna(), bins=50, color='steelblue', alpha=0.7, edgecolor='black')
+    ax1.hist(product_ratings, bins=50, color='steelblue', alpha=0.7, edgecolor='black')
     ax1.set_xlabel('Product Rating', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Frequency', fontsize=12, fontweight='bold')
     ax1.set_title('Q16.1: Product Rating Distribution', fontsize=14, fontweight='bold')
@@ -360,70 +599,87 @@ def rating_impact_analysis(df):
     # Sales by rating
     ax2 = axes[0, 1]
     colors_rating = plt.cm.RdYlGn(np.linspace(0, 1, len(rating_perf)))
-    ax2.bar(range(len(rating_perf)), rating_perf['sales']/1000, color=colors_rating, alpha=0.8)
-    ax2.set_xticks(range(len(rating_perf)))
-    ax2.set_xticklabels([f"{int(x.left)}-{int(x.right)}" for x in rating_perf.index], rotation=0)
+    rating_pos = np.arange(len(rating_perf))
+    ax2.bar(rating_pos, rating_perf['sales']/1000, color=colors_rating, alpha=0.8)
+    ax2.set_xticks(rating_pos)
+    ax2.set_xticklabels(rating_perf.index, rotation=0)
     ax2.set_ylabel('Sales Volume (Thousands)', fontsize=12, fontweight='bold')
     ax2.set_title('Q16.2: Sales Volume by Product Rating', fontsize=14, fontweight='bold')
     ax2.grid(axis='y', alpha=0.3)
     
     # Revenue correlation
     ax3 = axes[1, 0]
-    ax3.plot(range(len(rating_perf)), rating_perf['revenue']/1_000_000, marker='o', 
+    ax3.plot(rating_pos, rating_perf['revenue']/1_000_000, marker='o', 
             linewidth=2, markersize=8, color='darkred')
-    ax3.fill_between(range(len(rating_perf)), rating_perf['revenue']/1_000_000, alpha=0.3)
-    ax3.set_xticks(range(len(rating_perf)))
-    ax3.set_xticklabels([f"{int(x.left)}-{int(x.right)}" for x in rating_perf.index], rotation=0)
+    ax3.fill_between(rating_pos, rating_perf['revenue']/1_000_000, alpha=0.3)
+    ax3.set_xticks(rating_pos)
+    ax3.set_xticklabels(rating_perf.index, rotation=0)
     ax3.set_ylabel('Revenue (Million INR)', fontsize=12, fontweight='bold')
     ax3.set_title('Q16.3: Revenue by Product Rating', fontsize=14, fontweight='bold')
     ax3.grid(alpha=0.3)
     
     # Category-wise ratings
     ax4 = axes[1, 1]
-    cat_ratings = df.groupby('category')['product_rating'].mean().sort_values(ascending=False)
     colors_cat = plt.cm.viridis(np.linspace(0, 1, len(cat_ratings)))
-    ax4.barh(range(len(cat_ratings)), cat_ratings.values, color=colors_cat)
-    ax4.set_yticks(range(len(cat_ratings)))
+    cat_pos = np.arange(len(cat_ratings))
+    ax4.barh(cat_pos, cat_ratings.values, color=colors_cat)
+    ax4.set_yticks(cat_pos)
     ax4.set_yticklabels(cat_ratings.index)
     ax4.set_xlabel('Average Rating', fontsize=12, fontweight='bold')
     ax4.set_title('Q16.4: Average Rating by Category', fontsize=14, fontweight='bold')
     ax4.grid(axis='x', alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+
+def rating_impact_analysis(df):
+    """Question 16: Product rating patterns and sales impact"""
+    data = _compute_rating(df)
     return {
-        'figure': fig,
-        'rating_perf': rating_perf,
-        'category_ratings': cat_ratings
+        'figure': _plot_rating(data),
+        'rating_perf': data['rating_perf'],
+        'category_ratings': data['category_ratings']
     }
 
 
-def business_health_dashboard(df):
-    """Question 20: Comprehensive business health dashboard"""
-    df['order_date'] = pd.to_datetime(df['order_date'])
+def _compute_business_health(df):
+    """Metrics and aggregations behind the Q20 business health dashboard"""
+    shrink(df, _SHRINK_COLUMNS)
+    ensure_categorical(df, ['category', 'customer_spending_tier', 'brand'])
     
     # Key metrics
     total_revenue = df['final_amount_inr'].sum()
-    total_customers = df['customer_id'].nunique()
+    customer_codes, customer_ids = pd.factorize(df['customer_id'])
+    orders_per_customer = np.bincount(customer_codes[customer_codes >= 0], minlength=len(customer_ids))
+    total_customers = len(customer_ids)
     avg_order_value = df['final_amount_inr'].mean()
     transaction_count = len(df)
     
     # Calculate growth rates
-    recent_year = df[df['order_year'] == df['order_year'].max()]
-    prev_year = df[df['order_year'] == df['order_year'].max() - 1]
-    yoy_growth = ((recent_year['final_amount_inr'].sum() - prev_year['final_amount_inr'].sum()) 
-                  / prev_year['final_amount_inr'].sum() * 100) if len(prev_year) > 0 else 0
+    yearly = df.groupby('order_year', observed=True).agg(
+        revenue=('final_amount_inr', 'sum'),
+        customers=('customer_id', 'nunique')
+    )
+    recent_year = yearly.index.max()
+    if recent_year - 1 in yearly.index:
+        prev_revenue = yearly.loc[recent_year - 1, 'revenue']
+        yoy_growth = (yearly.loc[recent_year, 'revenue'] - prev_revenue) / prev_revenue * 100
+    else:
+        yoy_growth = 0
     
     # Retention metrics
-    repeat_customers = df.groupby('customer_id').size()
-    retention_rate = (repeat_customers[repeat_customers > 1].count() / total_customers * 100)
+    repeat_customers = np.count_nonzero(orders_per_customer > 1)
+    retention_rate = repeat_customers / total_customers * 100
 
     # Operational efficiency metrics
     # On-time delivery: define as deliveries within 7 days (approximation)
     on_time_pct = None
     avg_delivery_days = None
     if 'delivery_days' in df.columns:
-        avg_delivery_days = df['delivery_days'].dropna().mean()
-        on_time_pct = (df['delivery_days'].dropna() <= 7).sum() / df['delivery_days'].dropna().shape[0] * 100
+        delivery_days = df['delivery_days'].dropna().to_numpy()
+        avg_delivery_days = delivery_days.mean() if delivery_days.size else np.nan
+        on_time_pct = (delivery_days <= 7).mean() * 100 if delivery_days.size else np.nan
     else:
         on_time_pct = np.nan
         avg_delivery_days = np.nan
@@ -435,10 +691,64 @@ def business_health_dashboard(df):
         return_rate = np.nan
     
     # Category performance
-    top_category = df.groupby('category')['final_amount_inr'].sum().idxmax()
-    top_category_revenue = df.groupby('category')['final_amount_inr'].sum().max()
+    cat_revenue = _cat_sum(df['category'], df['final_amount_inr']).sort_values(ascending=False)
+    top_category = cat_revenue.index[0]
+    top_category_revenue = cat_revenue.iloc[0]
+    
+    # Segment, membership and brand splits
+    segment_revenue = _cat_sum(df['customer_spending_tier'], df['final_amount_inr'])
+    prime_revenue = df.groupby('is_prime_member', observed=True)['final_amount_inr'].sum()
+    top_brands = _brand_stats(df)['revenue'].nlargest(5)
     
-    fig = plt.figure(figsize=(18, 12))
+    # Brief executive insights (automated)
+    insights = []
+    insights.append(f"Total Revenue: ₹{total_revenue/1_000_000_000:.2f}B")
+    insights.append(f"YoY Growth: {yoy_growth:.2f}%")
+    insights.append(f"Customer Retention: {retention_rate:.1f}%")
+    if not np.isnan(on_time_pct):
+        insights.append(f"On-time Delivery: {on_time_pct:.1f}% (≤7 days)")
+    if not np.isnan(return_rate):
+        insights.append(f"Return Rate: {return_rate:.1f}%")
+    insights.append(f"Top Category: {top_category} (₹{top_category_revenue/1_000_000:.2f}M)")
+    
+    return {
+        'metrics': {
+            'total_revenue': total_revenue,
+            'total_customers': total_customers,
+            'avg_order_value': avg_order_value,
+            'yoy_growth': yoy_growth,
+            'retention_rate': retention_rate,
+            'on_time_pct': on_time_pct,
+            'avg_delivery_days': avg_delivery_days,
+            'return_rate': return_rate
+        },
+        'insights': insights,
+        'transaction_count': transaction_count,
+        'top_category': top_category,
+        'top_category_revenue': top_category_revenue,
+        'yearly': yearly,
+        'category_revenue': cat_revenue,
+        'segment_revenue': segment_revenue,
+        'prime_revenue': prime_revenue,
+        'top_brands': top_brands
+    }
+
+
+def _plot_business_health(data):
+    """Figure for the Q20 business health dashboard"""
+    metrics = data['metrics']
+    total_revenue, total_customers = metrics['total_revenue'], metrics['total_customers']
+    avg_order_value, yoy_growth = metrics['avg_order_value'], metrics['yoy_growth']
+    retention_rate = metrics['retention_rate']
+    transaction_count = data['transaction_count']
+    top_category, top_category_revenue = data['top_category'], data['top_category_revenue']
+    yearly = data['yearly']
+    cat_revenue = data['category_revenue']
+    segment_revenue = data['segment_revenue']
+    prime_revenue = data['prime_revenue']
+    top_brands = data['top_brands']
+    
+    fig = Figure(figsize=(18, 12))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
     
     # KPI cards (as text boxes)
@@ -458,7 +768,7 @@ def business_health_dashboard(df):
     
     # Revenue trend
     ax1 = fig.add_subplot(gs[1, 0])
-    yearly_revenue = df.groupby('order_year')['final_amount_inr'].sum()
+    yearly_revenue = yearly['revenue']
     ax1.plot(yearly_revenue.index, yearly_revenue.values/1_000_000, marker='o', linewidth=2, markersize=8)
     ax1.fill_between(yearly_revenue.index, yearly_revenue.values/1_000_000, alpha=0.3)
     ax1.set_xlabel('Year', fontweight='bold')
@@ -468,7 +778,7 @@ def business_health_dashboard(df):
     
     # Customer acquisition
     ax2 = fig.add_subplot(gs[1, 1])
-    yearly_customers = df.groupby('order_year')['customer_id'].nunique()
+    yearly_customers = yearly['customers']
     ax2.bar(yearly_customers.index, yearly_customers.values/1000, color='steelblue', alpha=0.8)
     ax2.set_xlabel('Year', fontweight='bold')
     ax2.set_ylabel('New Customers (Thousands)', fontweight='bold')
@@ -477,16 +787,15 @@ def business_health_dashboard(df):
     
     # Category distribution
     ax3 = fig.add_subplot(gs[1, 2])
-    cat_revenue = df.groupby('category')['final_amount_inr'].sum().sort_values(ascending=False)
     ax3.pie(cat_revenue.values, labels=cat_revenue.index, autopct='%1.1f%%', textprops={'fontsize': 8})
     ax3.set_title('Revenue by Category', fontsize=12, fontweight='bold')
     
     # Segment performance
     ax4 = fig.add_subplot(gs[2, 0])
-    segment_revenue = df.groupby('customer_spending_tier')['final_amount_inr'].sum()
     colors_seg = plt.cm.Spectral(np.linspace(0, 1, len(segment_revenue)))
-    ax4.bar(range(len(segment_revenue)), segment_revenue.values/1_000_000, color=colors_seg)
-    ax4.set_xticks(range(len(segment_revenue)))
+    tier_pos = np.arange(len(segment_revenue))
+    ax4.bar(tier_pos, segment_revenue.values/1_000_000, color=colors_seg)
+    ax4.set_xticks(tier_pos)
     ax4.set_xticklabels(segment_revenue.index, rotation=45, ha='right')
     ax4.set_ylabel('Revenue (Million INR)', fontweight='bold')
     ax4.set_title('Revenue by Customer Tier', fontsize=12, fontweight='bold')
@@ -494,45 +803,29 @@ def business_health_dashboard(df):
     
     # Prime vs Non-Prime
     ax5 = fig.add_subplot(gs[2, 1])
-    prime_revenue = df.groupby('is_prime_member')['final_amount_inr'].sum()
     ax5.pie(prime_revenue.values, labels=['Non-Prime', 'Prime'], autopct='%1.1f%%',
            colors=['#FFB6C6', '#FF69B4'])
     ax5.set_title('Revenue: Prime vs Non-Prime', fontsize=12, fontweight='bold')
     
     # Top 5 brands
     ax6 = fig.add_subplot(gs[2, 2])
-    top_brands = df.groupby('brand')['final_amount_inr'].sum().sort_values(ascending=False).head(5)
-    ax6.barh(range(len(top_brands)), top_brands.values/1_000_000, color='coral', alpha=0.8)
-    ax6.set_yticks(range(len(top_brands)))
+    top_pos = np.arange(len(top_brands))
+    ax6.barh(top_pos, top_brands.values/1_000_000, color='coral', alpha=0.8)
+    ax6.set_yticks(top_pos)
     ax6.set_yticklabels(top_brands.index, fontsize=9)
     ax6.set_xlabel('Revenue (Million INR)', fontweight='bold')
     ax6.set_title('Top 5 Brands', fontsize=12, fontweight='bold')
     ax6.grid(axis='x', alpha=0.3)
     
-    plt.suptitle('Q20: BUSINESS HEALTH DASHBOARD (2015-2025)', fontsize=16, fontweight='bold', y=0.995)
+    fig.suptitle('Q20: BUSINESS HEALTH DASHBOARD (2015-2025)', fontsize=16, fontweight='bold', y=0.995)
+    return fig
 
-    # Brief executive insights (automated)
-    insights = []
-    insights.append(f"Total Revenue: ₹{total_revenue/1_000_000_000:.2f}B")
-    insights.append(f"YoY Growth: {yoy_growth:.2f}%")
-    insights.append(f"Customer Retention: {retention_rate:.1f}%")
-    if not np.isnan(on_time_pct):
-        insights.append(f"On-time Delivery: {on_time_pct:.1f}% (≤7 days)")
-    if not np.isnan(return_rate):
-        insights.append(f"Return Rate: {return_rate:.1f}%")
-    insights.append(f"Top Category: {top_category} (₹{top_category_revenue/1_000_000:.2f}M)")
 
+def business_health_dashboard(df):
+    """Question 20: Comprehensive business health dashboard"""
+    data = _compute_business_health(df)
     return {
-        'figure': fig,
-        'metrics': {
-            'total_revenue': total_revenue,
-            'total_customers': total_customers,
-            'avg_order_value': avg_order_value,
-            'yoy_growth': yoy_growth,
-            'retention_rate': retention_rate,
-            'on_time_pct': on_time_pct,
-            'avg_delivery_days': avg_delivery_days,
-            'return_rate': return_rate
-        },
-        'insights': insights
+        'figure': _plot_business_health(data),
+        'metrics': data['metrics'],
+        'insights': data['insights']
     }
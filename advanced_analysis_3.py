@@ -7,24 +7,76 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from eda.analysis_helpers import ensure_categorical, ensure_order_date, memoized, shrink
 
-def clv_cohort_analysis(df):
+
+# Numeric columns the Q14-Q19 analyses downcast before aggregating
+_SHRINK_COLUMNS = ('final_amount_inr', 'original_price_inr', 'discount_percent', 'product_rating', 'quantity')
+
+
+def _plot_sample(frame, limit=50_000):
+    """Rows to draw in a scatter: all of them up to limit, otherwise a reproducible random subset"""
+    if len(frame) <= limit:
+        return frame
+    rows = np.sort(np.random.default_rng(0).choice(len(frame), size=limit, replace=False))
+    return frame.iloc[rows]
+
+
+def _compute_customer_stats(df):
+    """One row per customer: first/last category, purchase counts, value and active dates"""
+    # One positional grouping by customer serves every per-customer column below
+    journey_rows = df[['category', 'final_amount_inr', 'order_date']].reset_index(drop=True)
+    by_customer = journey_rows.groupby(df['customer_id'].reset_index(drop=True), observed=True)
+    
+    # First/last purchase category, taken from each customer's earliest/latest order row
+    # instead of sorting the frame
+    first_pos = by_customer['order_date'].idxmin()
+    last_pos = by_customer['order_date'].idxmax()
+    
+    # Columns are built one at a time and joined on the customer index, so category
+    # columns stay categorical throughout
+    return pd.concat({
+        'first_category': journey_rows['category'].iloc[first_pos.to_numpy()].set_axis(first_pos.index),
+        'last_category': journey_rows['category'].iloc[last_pos.to_numpy()].set_axis(last_pos.index),
+        'total_purchases': by_customer['category'].count(),
+        'category_diversity': by_customer['category'].nunique(),
+        'total_value': by_customer['final_amount_inr'].sum(),
+        'avg_value': by_customer['final_amount_inr'].mean(),
+        'first_date': by_customer['order_date'].min(),
+        'last_date': by_customer['order_date'].max(),
+        'orders': by_customer.size()
+    }, axis=1)
+
+
+def _customer_stats(df):
+    """Per-customer summary shared by Q14 and Q17"""
+    ensure_order_date(df)
+    ensure_categorical(df, ['customer_id', 'category'])
+    shrink(df, _SHRINK_COLUMNS)
+    return memoized(df, 'customer_stats', lambda: _compute_customer_stats(df),
+                    columns=['customer_id', 'category', 'final_amount_inr', 'order_date'])
+
+
+def clv_cohort_analysis(df, keep_intermediates=False):
     """Question 14: Customer Lifetime Value & Cohort Analysis"""
-    df['order_date'] = pd.to_datetime(df['order_date'])
-    df['cohort_year'] = df['order_date'].dt.year
-    
-    # CLV by customer acquisition year
-    customer_clv = df.groupby(['customer_id', 'cohort_year']).agg({
-        'final_amount_inr': 'sum',
-        'order_date': 'count'
-    }).rename(columns={'order_date': 'purchase_count'}).reset_index()
-    
-    cohort_clv = customer_clv.groupby('cohort_year').agg({
-        'final_amount_inr': ['mean', 'median', 'sum'],
-        'customer_id': 'count'
-    }).round(2)
-    
-    cohort_clv.columns = ['avg_clv', 'median_clv', 'total_value', 'customer_count']
+    ensure_order_date(df)
+    ensure_categorical(df, ['customer_id'])
+    shrink(df, _SHRINK_COLUMNS)
+    cohort_year = df['order_date'].dt.year.astype('int16').rename('cohort_year')
+    
+    # CLV by customer acquisition year; only the columns the aggregation needs are
+    # grouped and the caller's frame is not widened with a helper column
+    customer_clv = df[['final_amount_inr', 'order_date']].groupby([df['customer_id'], cohort_year], observed=True).agg(
+        final_amount_inr=('final_amount_inr', 'sum'),
+        purchase_count=('order_date', 'count')
+    ).reset_index()
+    
+    cohort_clv = customer_clv.groupby('cohort_year', observed=True).agg(
+        avg_clv=('final_amount_inr', 'mean'),
+        median_clv=('final_amount_inr', 'median'),
+        total_value=('final_amount_inr', 'sum'),
+        customer_count=('customer_id', 'count')
+    ).round(2)
     
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
@@ -40,17 +92,20 @@ def clv_cohort_analysis(df):
     
     # Retention curves (simplified)
     ax2 = axes[0, 1]
-    retention_by_cohort = []
-    for cohort in sorted(df['cohort_year'].unique()):
-        cohort_customers = df[df['cohort_year'] == cohort]['customer_id'].unique()
-        repeat_customers = df[(df['customer_id'].isin(cohort_customers)) & 
-                             (df['order_date'].dt.year > cohort)]['customer_id'].nunique()
-        retention_rate = (repeat_customers / len(cohort_customers) * 100) if len(cohort_customers) > 0 else 0
-        retention_by_cohort.append(retention_rate)
-    
-    ax2.plot(sorted(df['cohort_year'].unique()), retention_by_cohort, marker='o', 
+    # customer_clv holds one row per (customer, active year); a customer is retained from a
+    # year if they also bought in any later year. Each customer's last active year comes
+    # from the shared per-customer summary, looked up by categorical code.
+    customer_stats = _customer_stats(df)
+    customer_codes = customer_clv['customer_id'].cat.codes.to_numpy()
+    active_years = customer_clv['cohort_year'].to_numpy()
+    last_year = np.zeros(len(customer_clv['customer_id'].cat.categories), dtype=active_years.dtype)
+    last_year[customer_stats.index.codes] = customer_stats['last_date'].dt.year.fillna(0).to_numpy(dtype=active_years.dtype)
+    retained = pd.Series(last_year[customer_codes] > active_years)
+    retention_by_cohort = retained.groupby(active_years, observed=True).mean() * 100
+    
+    ax2.plot(retention_by_cohort.index, retention_by_cohort.values, marker='o', 
             linewidth=2, markersize=8, color='darkblue')
-    ax2.fill_between(sorted(df['cohort_year'].unique()), retention_by_cohort, alpha=0.3)
+    ax2.fill_between(retention_by_cohort.index, retention_by_cohort.values, alpha=0.3)
     ax2.set_xlabel('Cohort Year', fontsize=12, fontweight='bold')
     ax2.set_ylabel('Retention Rate (%)', fontsize=12, fontweight='bold')
     ax2.set_title('Q14.2: Customer Retention by Cohort', fontsize=14, fontweight='bold')
@@ -58,7 +113,9 @@ def clv_cohort_analysis(df):
     
     # CLV distribution
     ax3 = axes[1, 0]
-    ax3.hist(customer_clv['final_amount_inr'], bins=50, color='steelblue', alpha=0.7, edgecolor='black')
+    clv_hist, clv_bins = np.histogram(customer_clv['final_amount_inr'].to_numpy(), bins=50)
+    ax3.bar(clv_bins[:-1], clv_hist, width=np.diff(clv_bins), align='edge',
+            color='steelblue', alpha=0.7, edgecolor='black')
     ax3.axvline(customer_clv['final_amount_inr'].mean(), color='red', linestyle='--', linewidth=2, label='Mean')
     ax3.axvline(customer_clv['final_amount_inr'].median(), color='green', linestyle='--', linewidth=2, label='Median')
     ax3.set_xlabel('CLV (INR)', fontsize=12, fontweight='bold')
@@ -69,8 +126,14 @@ def clv_cohort_analysis(df):
     
     # Top CLV segments
     ax4 = axes[1, 1]
-    clv_percentiles = pd.qcut(customer_clv['final_amount_inr'], q=4, labels=['Bottom 25%', '25-50%', '50-75%', 'Top 25%'])
-    segment_clv = customer_clv.groupby(clv_percentiles)['final_amount_inr'].agg(['sum', 'count'])
+    # Quartile bins as pd.qcut draws them (right-closed, lowest value included), summed with bincount
+    clv_values = customer_clv['final_amount_inr'].to_numpy()
+    clv_edges = np.quantile(clv_values, [0.25, 0.5, 0.75])
+    clv_segment = np.searchsorted(clv_edges, clv_values, side='left')
+    segment_clv = pd.DataFrame({
+        'sum': np.bincount(clv_segment, weights=clv_values, minlength=4),
+        'count': np.bincount(clv_segment, minlength=4)
+    }, index=['Bottom 25%', '25-50%', '50-75%', 'Top 25%'])
     colors_seg = ['#FFB6C6', '#FFE4E1', '#FFC0CB', '#FF69B4']
     ax4.pie(segment_clv['sum'], labels=segment_clv.index, autopct='%1.1f%%', 
            colors=colors_seg, startangle=90)
@@ -78,49 +141,39 @@ def clv_cohort_analysis(df):
     
     plt.tight_layout()
     
-    return {
+    result = {
         'figure': fig,
-        'cohort_clv': cohort_clv,
-        'customer_clv': customer_clv
+        'cohort_clv': cohort_clv
     }
+    # Per-customer frames are only handed back on request so callers running every
+    # analysis do not keep them all alive at once
+    if keep_intermediates:
+        result['customer_clv'] = customer_clv
+    return result
 
 
-def customer_journey_analysis(df):
+def customer_journey_analysis(df, keep_intermediates=False):
     """Question 17: Customer Journey Analysis"""
-    df['order_date'] = pd.to_datetime(df['order_date'])
+    customer_stats = _customer_stats(df)
     
     # Purchase frequency by customer
-    purchase_freq = df.groupby('customer_id').size()
-    
-    # Category transitions (first purchase category vs last purchase category)
-    customer_journey = df.sort_values('order_date').groupby('customer_id').agg({
-        'category': ['first', 'last', 'count', lambda x: x.nunique()],
-        'final_amount_inr': ['sum', 'mean'],
-        'order_date': ['min', 'max']
-    }).reset_index()
-    
-    customer_journey.columns = ['customer_id', 'first_category', 'last_category', 
-                               'total_purchases', 'category_diversity', 
-                               'total_value', 'avg_value', 'first_date', 'last_date']
+    purchase_freq = customer_stats['orders']
     
-    # Customer lifecycle segments
-    def lifecycle_segment(purchases):
-        if purchases == 1:
-            return 'One-time Buyer'
-        elif purchases <= 3:
-            return 'Occasional Buyer'
-        elif purchases <= 10:
-            return 'Regular Buyer'
-        else:
-            return 'Loyal Customer'
+    # Category transitions (first purchase category vs last purchase category), kept
+    # indexed by customer_id
+    customer_journey = customer_stats.drop(columns='orders')
     
-    customer_journey['lifecycle'] = customer_journey['total_purchases'].apply(lifecycle_segment)
+    # Customer lifecycle segments: 1, 2-3, 4-10 and 11+ purchases
+    customer_journey['lifecycle'] = pd.cut(customer_journey['total_purchases'], bins=[0, 1, 3, 10, np.inf],
+                                           labels=['One-time Buyer', 'Occasional Buyer', 'Regular Buyer', 'Loyal Customer'])
     
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
     # Purchase frequency distribution
     ax1 = axes[0, 0]
-    ax1.hist(purchase_freq, bins=50, color='steelblue', alpha=0.7, edgecolor='black')
+    freq_hist, freq_bins = np.histogram(purchase_freq.to_numpy(), bins=50)
+    ax1.bar(freq_bins[:-1], freq_hist, width=np.diff(freq_bins), align='edge',
+            color='steelblue', alpha=0.7, edgecolor='black')
     ax1.axvline(purchase_freq.mean(), color='red', linestyle='--', linewidth=2)
     ax1.set_xlabel('Purchase Frequency', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Number of Customers', fontsize=12, fontweight='bold')
@@ -142,7 +195,7 @@ def customer_journey_analysis(df):
     
     # Value by lifecycle
     ax3 = axes[1, 0]
-    lifecycle_value = customer_journey.groupby('lifecycle')['total_value'].agg(['mean', 'sum'])
+    lifecycle_value = customer_journey.groupby('lifecycle', observed=True)['total_value'].agg(['mean', 'sum'])
     lifecycle_value = lifecycle_value.reindex(lifecycle_order)
     ax3.bar(range(len(lifecycle_value)), lifecycle_value['mean']/1000, color=colors_lifecycle, alpha=0.8)
     ax3.set_xticks(range(len(lifecycle_value)))
@@ -153,9 +206,9 @@ def customer_journey_analysis(df):
     
     # Category diversity
     ax4 = axes[1, 1]
-    ax4.scatter(customer_journey['category_diversity'], customer_journey['total_value']/1000,
-               s=customer_journey['total_purchases']*2, alpha=0.5, 
-               c=range(len(customer_journey)), cmap='viridis')
+    journey_points = _plot_sample(customer_journey)
+    ax4.scatter(journey_points['category_diversity'], journey_points['total_value']/1000,
+               s=journey_points['total_purchases']*2, alpha=0.5, color='steelblue')
     ax4.set_xlabel('Category Diversity (Number of Categories)', fontsize=12, fontweight='bold')
     ax4.set_ylabel('Total Customer Value (Thousands INR)', fontsize=12, fontweight='bold')
     ax4.set_title('Q17.4: Category Diversity vs CLV', fontsize=14, fontweight='bold')
@@ -163,27 +216,31 @@ def customer_journey_analysis(df):
     
     plt.tight_layout()
     
-    return {
+    result = {
         'figure': fig,
-        'customer_journey': customer_journey,
         'lifecycle_counts': lifecycle_counts
     }
+    if keep_intermediates:
+        result['customer_journey'] = customer_journey
+    return result
 
 
-def inventory_lifecycle_analysis(df):
+def inventory_lifecycle_analysis(df, keep_intermediates=False):
     """Question 18: Product Lifecycle & Inventory Patterns"""
-    df['order_date'] = pd.to_datetime(df['order_date'])
-    
-    # Product launch analysis
-    product_lifecycle = df.groupby('product_id').agg({
-        'order_date': ['min', 'max', 'count'],
-        'final_amount_inr': ['sum', 'mean'],
-        'category': 'first',
-        'product_rating': 'mean'
-    }).reset_index()
-    
-    product_lifecycle.columns = ['product_id', 'launch_date', 'last_sale_date', 
-                                'total_sales', 'revenue', 'avg_price', 'category', 'rating']
+    ensure_order_date(df)
+    ensure_categorical(df, ['product_id', 'category'])
+    shrink(df, _SHRINK_COLUMNS)
+    
+    # Product launch analysis, kept indexed by product_id
+    product_lifecycle = df.groupby('product_id', observed=True).agg(
+        launch_date=('order_date', 'min'),
+        last_sale_date=('order_date', 'max'),
+        total_sales=('order_date', 'count'),
+        revenue=('final_amount_inr', 'sum'),
+        avg_price=('final_amount_inr', 'mean'),
+        category=('category', 'first'),
+        rating=('product_rating', 'mean')
+    )
     
     product_lifecycle['lifecycle_months'] = (product_lifecycle['last_sale_date'] - 
                                              product_lifecycle['launch_date']).dt.days / 30.44
@@ -192,7 +249,8 @@ def inventory_lifecycle_analysis(df):
     
     # Product lifecycle length distribution
     ax1 = axes[0, 0]
-    ax1.hist(product_lifecycle['lifecycle_months'].dropna(), bins=50, 
+    months_hist, months_bins = np.histogram(product_lifecycle['lifecycle_months'].dropna().to_numpy(), bins=50)
+    ax1.bar(months_bins[:-1], months_hist, width=np.diff(months_bins), align='edge',
             color='steelblue', alpha=0.7, edgecolor='black')
     ax1.axvline(product_lifecycle['lifecycle_months'].mean(), color='red', 
                linestyle='--', linewidth=2, label='Average')
@@ -204,19 +262,11 @@ def inventory_lifecycle_analysis(df):
     
     # Revenue by lifecycle phase
     ax2 = axes[0, 1]
-    def lifecycle_phase(months):
-        if months <= 12:
-            return 'Launch Phase (0-12m)'
-        elif months <= 36:
-            return 'Growth Phase (12-36m)'
-        elif months <= 60:
-            return 'Maturity Phase (36-60m)'
-        else:
-            return 'Decline Phase (60m+)'
-    
-    product_lifecycle['phase'] = product_lifecycle['lifecycle_months'].apply(lifecycle_phase)
-    phase_revenue = product_lifecycle.groupby('phase')['revenue'].agg(['sum', 'count', 'mean'])
     phase_order = ['Launch Phase (0-12m)', 'Growth Phase (12-36m)', 'Maturity Phase (36-60m)', 'Decline Phase (60m+)']
+    # Products without a measurable lifecycle fall through to the last phase, as before
+    product_lifecycle['phase'] = pd.cut(product_lifecycle['lifecycle_months'], bins=[-np.inf, 12, 36, 60, np.inf],
+                                        labels=phase_order).fillna(phase_order[-1])
+    phase_revenue = product_lifecycle.groupby('phase', observed=True)['revenue'].agg(['sum', 'count', 'mean'])
     phase_revenue = phase_revenue.reindex([p for p in phase_order if p in phase_revenue.index])
     
     colors_phase = ['#90EE90', '#FFD700', '#FFA500', '#FF6347']
@@ -230,7 +280,7 @@ def inventory_lifecycle_analysis(df):
     
     # Category lifecycle trends
     ax3 = axes[1, 0]
-    cat_lifecycle = product_lifecycle.groupby('category')['lifecycle_months'].mean().sort_values(ascending=False)
+    cat_lifecycle = product_lifecycle.groupby('category', observed=True)['lifecycle_months'].mean().sort_values(ascending=False)
     colors_cat = plt.cm.tab10(np.linspace(0, 1, len(cat_lifecycle)))
     ax3.barh(range(len(cat_lifecycle)), cat_lifecycle.values, color=colors_cat)
     ax3.set_yticks(range(len(cat_lifecycle)))
@@ -241,9 +291,10 @@ def inventory_lifecycle_analysis(df):
     
     # Product rating vs sales
     ax4 = axes[1, 1]
-    ax4.scatter(product_lifecycle['rating'].dropna(), product_lifecycle['total_sales'],
-               s=product_lifecycle['revenue']/10000, alpha=0.5,
-               c=product_lifecycle['lifecycle_months'], cmap='viridis')
+    product_points = _plot_sample(product_lifecycle)
+    ax4.scatter(product_points['rating'].dropna(), product_points['total_sales'],
+               s=product_points['revenue']/10000, alpha=0.5,
+               c=product_points['lifecycle_months'].to_numpy(dtype=np.float32), cmap='viridis')
     ax4.set_xlabel('Product Rating', fontsize=12, fontweight='bold')
     ax4.set_ylabel('Total Sales (Units)', fontsize=12, fontweight='bold')
     ax4.set_title('Q18.4: Rating vs Sales Volume (Color: Lifecycle)', fontsize=14, fontweight='bold')
@@ -251,33 +302,62 @@ def inventory_lifecycle_analysis(df):
     
     plt.tight_layout()
     
-    return {
+    result = {
         'figure': fig,
-        'product_lifecycle': product_lifecycle,
         'phase_analysis': phase_revenue
     }
+    if keep_intermediates:
+        result['product_lifecycle'] = product_lifecycle
+    return result
 
 
-def competitive_pricing_analysis(df):
+def competitive_pricing_analysis(df, keep_intermediates=False):
     """Question 19: Competitive Pricing Analysis"""
+    ensure_categorical(df, ['category', 'brand'])
+    shrink(df, _SHRINK_COLUMNS)
     # Price positioning by category and brand
-    competitive_pos = df.groupby(['category', 'brand']).agg({
-        'original_price_inr': ['mean', 'min', 'max'],
-        'discount_percent': 'mean',
-        'final_amount_inr': ['sum', 'count'],
-        'product_rating': 'mean'
-    }).reset_index()
-    
-    competitive_pos.columns = ['category', 'brand', 'avg_price', 'min_price', 'max_price',
-                              'avg_discount', 'revenue', 'market_share', 'rating']
+    competitive_pos = df.groupby(['category', 'brand'], observed=True).agg(
+        avg_price=('original_price_inr', 'mean'),
+        min_price=('original_price_inr', 'min'),
+        max_price=('original_price_inr', 'max'),
+        avg_discount=('discount_percent', 'mean'),
+        revenue=('final_amount_inr', 'sum'),
+        market_share=('final_amount_inr', 'count'),
+        rating=('product_rating', 'mean')
+    )
+    
+    # Brand-level views are rolled up from the (category, brand) table, not the raw rows
+    brand_stats = competitive_pos.groupby(level='brand', observed=True).agg(
+        avg_price=('avg_price', 'mean'),
+        market_share=('market_share', 'sum'),
+        revenue=('revenue', 'sum'),
+        avg_discount=('avg_discount', 'mean'),
+        rating=('rating', 'mean')
+    ).reset_index()
     
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
     # Top 10 categories - price distribution
     ax1 = axes[0, 0]
-    top_categories = df.groupby('category')['final_amount_inr'].sum().nlargest(10).index
-    df_top = df[df['category'].isin(top_categories)]
-    df_top.boxplot(column='original_price_inr', by='category', ax=ax1)
+    top_categories = df.groupby('category', observed=True)['final_amount_inr'].sum().nlargest(10).index
+    # Mask on the integer category codes and keep only the two columns the boxes need
+    top_mask = np.isin(df['category'].cat.codes.to_numpy(), df['category'].cat.categories.get_indexer(top_categories))
+    df_top = df.loc[top_mask, ['category', 'original_price_inr']]
+    # Box statistics computed in one grouped pass and drawn with bxp: Tukey whiskers
+    # (furthest prices within 1.5 IQR of the box), outlier markers omitted
+    top_prices = df_top['original_price_inr']
+    top_keys = df_top['category'].cat.remove_unused_categories()
+    quartiles = top_prices.groupby(top_keys, observed=True).quantile([0.25, 0.5, 0.75]).unstack()
+    iqr = quartiles[0.75] - quartiles[0.25]
+    top_codes = top_keys.cat.codes.to_numpy()
+    low_fence = (quartiles[0.25] - 1.5 * iqr).to_numpy()[top_codes]
+    high_fence = (quartiles[0.75] + 1.5 * iqr).to_numpy()[top_codes]
+    inside = (top_prices.to_numpy() >= low_fence) & (top_prices.to_numpy() <= high_fence)
+    whiskers = top_prices[inside].groupby(top_keys[inside], observed=True).agg(['min', 'max'])
+    box_stats = [{'label': cat, 'q1': q1, 'med': med, 'q3': q3, 'whislo': lo, 'whishi': hi}
+                 for cat, q1, med, q3, lo, hi in zip(quartiles.index, quartiles[0.25], quartiles[0.5],
+                                                     quartiles[0.75], whiskers['min'], whiskers['max'])]
+    ax1.bxp(box_stats, showfliers=False)
     ax1.set_xlabel('Category', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Price (INR)', fontsize=12, fontweight='bold')
     ax1.set_title('Q19.1: Price Distribution by Top 10 Categories', fontsize=14, fontweight='bold')
@@ -286,15 +366,11 @@ def competitive_pricing_analysis(df):
     
     # Price vs market share
     ax2 = axes[0, 1]
-    brand_position = competitive_pos.groupby('brand').agg({
-        'avg_price': 'mean',
-        'market_share': 'sum',
-        'revenue': 'sum'
-    }).reset_index()
+    brand_position = brand_stats[['brand', 'avg_price', 'market_share', 'revenue']]
     brand_position = brand_position[brand_position['market_share'] > 50].sort_values('market_share', ascending=False).head(15)
     
     ax2.scatter(brand_position['avg_price'], brand_position['market_share'],
-               s=brand_position['revenue']/10000, alpha=0.6, c=range(len(brand_position)), cmap='viridis')
+               s=brand_position['revenue']/10000, alpha=0.6, color='steelblue')
     for idx, row in brand_position.head(5).iterrows():
         ax2.annotate(row['brand'], (row['avg_price'], row['market_share']), 
                     fontsize=8, ha='center')
@@ -305,7 +381,7 @@ def competitive_pricing_analysis(df):
     
     # Price elasticity by category
     ax3 = axes[1, 0]
-    price_elasticity = df.groupby('category').agg({
+    price_elasticity = df.groupby('category', observed=True).agg({
         'original_price_inr': 'mean',
         'quantity': 'sum'
     }).reset_index()
@@ -314,7 +390,7 @@ def competitive_pricing_analysis(df):
     
     colors_elasticity = plt.cm.RdYlGn_r(np.linspace(0, 1, len(price_elasticity)))
     ax3.scatter(price_elasticity['original_price_inr']/1000, price_elasticity['quantity'],
-               s=100, alpha=0.6, c=range(len(price_elasticity)), cmap='viridis')
+               s=100, alpha=0.6, color='steelblue')
     for idx, row in price_elasticity.head(8).iterrows():
         ax3.annotate(row['category'], (row['original_price_inr']/1000, row['quantity']), 
                     fontsize=8, ha='center')
@@ -325,12 +401,9 @@ def competitive_pricing_analysis(df):
     
     # Discount strategy by brand
     ax4 = axes[1, 1]
-    brand_discount = competitive_pos.groupby('brand').agg({
-        'avg_discount': 'mean',
-        'rating': 'mean'
-    }).reset_index().sort_values('avg_discount', ascending=False).head(15)
+    brand_discount = brand_stats[['brand', 'avg_discount', 'rating']].sort_values('avg_discount', ascending=False).head(15)
     
-    colors_discount = ['green' if x > 3.5 else 'red' for x in brand_discount['rating']]
+    colors_discount = np.where(brand_discount['rating'].to_numpy() > 3.5, 'green', 'red')
     ax4.barh(range(len(brand_discount)), brand_discount['avg_discount'], color=colors_discount, alpha=0.8)
     ax4.set_yticks(range(len(brand_discount)))
     ax4.set_yticklabels(brand_discount['brand'], fontsize=9)
@@ -340,8 +413,10 @@ def competitive_pricing_analysis(df):
     
     plt.tight_layout()
     
-    return {
+    result = {
         'figure': fig,
-        'competitive_pos': competitive_pos,
         'brand_position': brand_position
     }
+    if keep_intermediates:
+        result['competitive_pos'] = competitive_pos.reset_index()
+    return result
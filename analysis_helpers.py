@@ -0,0 +1,65 @@
+"""
+Helpers shared by the advanced EDA analysis modules
+"""
+import hashlib
+import weakref
+
+import pandas as pd
+
+
+def ensure_order_date(df):
+    """Parse order_date once; frames that already hold datetimes are left alone"""
+    if not pd.api.types.is_datetime64_any_dtype(df['order_date']):
+        df['order_date'] = pd.to_datetime(df['order_date'], format='ISO8601', cache=True)
+    return df
+
+
+def ensure_categorical(df, cols):
+    """Cast grouping keys to category once; columns that already are categorical are left alone"""
+    for col in cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def shrink(df, cols):
+    """Downcast the 64-bit numeric columns among cols in place; already-narrow columns are skipped"""
+    for col in cols:
+        if col not in df.columns or df[col].dtype.itemsize < 8:
+            continue
+        if df[col].dtype.kind == 'f':
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        elif df[col].dtype.kind in 'iu':
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+_AGG_CACHE = {}
+
+
+def frame_token(df, columns):
+    """Content fingerprint of df[columns]: length, exact dtypes and a hash of every value and index label.
+
+    Dtypes are compared as objects, so a categorical with different categories changes the token too.
+    """
+    columns = list(columns)
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=True).to_numpy()
+    content = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+    return (len(df), tuple(columns), tuple(df.dtypes[columns]), content)
+
+
+def memoized(df, name, compute, columns):
+    """Reuse an aggregation shared by several analyses, keyed on the frame object and a frame_token
+    of the columns compute reads.
+
+    Any edit to those columns changes the token and recomputes the entry, so only the aggregation is
+    saved, not the hash; all entries are evicted when df is garbage collected.
+    """
+    token = frame_token(df, columns)
+    entries = _AGG_CACHE.get(id(df))
+    if entries is None:
+        entries = _AGG_CACHE[id(df)] = {}
+        weakref.finalize(df, _AGG_CACHE.pop, id(df), None)
+    if name not in entries or entries[name][0] != token:
+        entries[name] = (token, compute())
+    return entries[name][1]
@@ -417,8 +417,8 @@ elif tab_selection == "� Revenue Analytics Bundle (Q6-Q10)":
         tier_data = result['tier_analysis']
         
         with col1:
-            top_state = geo_perf.index[0]
-            top_rev = geo_perf['revenue'].iloc[0]
+            top_state = geo_perf['revenue'].idxmax()
+            top_rev = geo_perf.loc[top_state, 'revenue']
             st.metric(
                 "🏆 Top State",
                 top_state,
@@ -119,12 +119,12 @@ def show_executive_dashboard(df):
     with exec_tab2:
         st.markdown("## Performance Trends")
         
-        # Date-based analysis
-        df['date'] = pd.to_datetime(df['order_date'])
+        # Date-based analysis; kept as a local series because df may be shared across sessions
+        order_dates = pd.to_datetime(df['order_date'])
         
         # Monthly trend
         st.markdown("### 📈 Monthly Revenue Trend")
-        monthly_data = df.groupby(df['date'].dt.to_period('M'))['final_amount_inr'].agg(['sum', 'count', 'mean'])
+        monthly_data = df.groupby(order_dates.dt.to_period('M'))['final_amount_inr'].agg(['sum', 'count', 'mean'])
         monthly_data.index = monthly_data.index.to_timestamp()
         monthly_data.columns = ['Revenue', 'Orders', 'Avg Value']
         
@@ -163,7 +163,8 @@ def show_executive_dashboard(df):
         st.markdown("### 🎯 Top Category Trends")
         
         top_cat = df.groupby('category')['final_amount_inr'].sum().idxmax()
-        cat_monthly = df[df['category'] == top_cat].groupby(df[df['category'] == top_cat]['date'].dt.to_period('M'))['final_amount_inr'].sum()
+        top_cat_mask = df['category'] == top_cat
+        cat_monthly = df[top_cat_mask].groupby(order_dates[top_cat_mask].dt.to_period('M'))['final_amount_inr'].sum()
         cat_monthly.index = cat_monthly.index.to_timestamp()
         
         st.line_chart(cat_monthly)